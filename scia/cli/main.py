@@ -1,10 +1,13 @@
 """Command-line interface for SCIA - SQL Change Impact Analyzer."""
 import argparse
 import asyncio
+import io
 import json  # pylint: disable=import-self
 import logging
+import os
 import sys
-from typing import List
+from contextlib import redirect_stdout
+from typing import List, Optional, Tuple, Union
 
 from scia.config.connection import load_connection_config
 from scia.core.analyze import analyze
@@ -18,7 +21,7 @@ from scia.warehouse import get_adapter
 
 logger = logging.getLogger(__name__)
 
-def load_schema_file(path: str) -> List[TableSchema]:
+def load_schema_file(path: Union[str, os.PathLike]) -> List[TableSchema]:
     """Internal helper to load schema from JSON file."""
     with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
@@ -192,7 +195,6 @@ def _validate_args(args, input_type):
     # Validate connection file exists if specified
     conn_file = getattr(args, 'conn_file', None)
     if conn_file:
-        import os
         if not os.path.exists(conn_file):
             print(
                 f"Error: Connection file not found: {conn_file}\n"
@@ -261,8 +263,8 @@ def _load_sql_after(args, metadata, adapter, before_schema, dialect='snowflake')
         return _fetch_schema_from_db(args.after, adapter), sql_defs
     return load_schema_file(args.after), sql_defs
 
-def main():
-    """Parse command line arguments and execute appropriate command."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the scia command."""
     parser = argparse.ArgumentParser(
         description="SCIA - SQL Change Impact Analyzer",
         epilog="Examples:\n"
@@ -336,16 +338,55 @@ def main():
     diff_parser.add_argument("--before", required=True)
     diff_parser.add_argument("--after", required=True)
 
-    args = parser.parse_args()
+    return parser
 
-    if args.command == "analyze":
-        asyncio.run(run_analyze(args))
-    elif args.command == "diff":
-        # Simplified for backward compatibility
-        asyncio.run(run_analyze(args))
-    else:
-        parser.print_help()
-        sys.exit(1)
+
+def _dispatch(args: argparse.Namespace) -> int:
+    """Execute a parsed command and return its exit code.
+
+    A string SystemExit message is written to stderr with exit code 1, as the
+    interpreter would do.
+    """
+    try:
+        if args.command in ("analyze", "diff"):
+            # diff is simplified to analyze for backward compatibility
+            asyncio.run(run_analyze(args))
+        else:
+            build_parser().print_help()
+            return 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def run(args: argparse.Namespace) -> Tuple[int, str]:
+    """Execute a parsed command without exiting the interpreter.
+
+    Returns:
+        Tuple of (exit code, captured stdout). Errors and warnings still go
+        to stderr as they happen. If the command raises, the stdout captured
+        so far is written out before the exception propagates.
+    """
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            code = _dispatch(args)
+    except BaseException:
+        sys.stdout.write(out.getvalue())
+        raise
+    return code, out.getvalue()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Parse command line arguments and execute appropriate command.
+
+    Args:
+        argv: Arguments without the program name; defaults to sys.argv[1:].
+    """
+    sys.exit(_dispatch(build_parser().parse_args(argv)))
 
 if __name__ == "__main__":
     main()
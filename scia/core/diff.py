@@ -1,5 +1,5 @@
 """Schema diffing and change detection."""
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -22,6 +22,14 @@ class SchemaDiff(BaseModel):
     changes: List[SchemaChange] = []
 
 
+def _ordered_keys(before_map: Dict[str, Any], after_map: Dict[str, Any]) -> List[str]:
+    """Union of keys in first-seen order: before's keys, then keys new in after.
+
+    Unlike a set union this keeps diff output order stable across runs.
+    """
+    return list(dict.fromkeys([*before_map, *after_map]))
+
+
 def diff_schemas(before: List[TableSchema], after: List[TableSchema]) -> SchemaDiff:
     """Compare two schema lists and identify changes hierarchically.
 
@@ -32,6 +40,10 @@ def diff_schemas(before: List[TableSchema], after: List[TableSchema]) -> SchemaD
     Returns:
         SchemaDiff containing all detected changes
     """
+    # Unchanged snapshots are common; skip the walk entirely
+    if before is after or before == after:
+        return SchemaDiff(changes=[])
+
     all_changes = []
 
     # Group tables by schema for hierarchy
@@ -44,9 +56,7 @@ def diff_schemas(before: List[TableSchema], after: List[TableSchema]) -> SchemaD
         after_schemas.setdefault(t.schema_name, []).append(t)
 
     # 1. Schema Level Comparison
-    all_schema_names = set(before_schemas.keys()) | set(after_schemas.keys())
-
-    for schema_name in all_schema_names:
+    for schema_name in _ordered_keys(before_schemas, after_schemas):
         _process_schema_level_diff(
             schema_name,
             before_schemas.get(schema_name),
@@ -84,9 +94,7 @@ def _process_schema_level_diff(
     before_table_map = {t.table_name: t for t in b_tables}
     after_table_map = {t.table_name: t for t in a_tables}
 
-    all_table_names = set(before_table_map.keys()) | set(after_table_map.keys())
-
-    for table_name in all_table_names:
+    for table_name in _ordered_keys(before_table_map, after_table_map):
         _process_table_level_diff(
             schema_name,
             table_name,
@@ -128,17 +136,18 @@ def _process_table_level_diff(
 def _process_column_level_diff(schema_name: str, table_name: str,
                              before_table: TableSchema, after_table: TableSchema,
                              changes: list) -> None:
-    """Compare columns within a table that exists in both versions."""
+    """Compare columns within a table that exists in both versions.
+
+    Changes are emitted in before's column order, followed by columns that
+    only exist in after.
+    """
     before_cols = {c.column_name: c for c in before_table.columns}
     after_cols = {c.column_name: c for c in after_table.columns}
 
-    all_col_names = set(before_cols.keys()) | set(after_cols.keys())
-
-    for col_name in all_col_names:
-        b_col = before_cols.get(col_name)
+    for col_name, b_col in before_cols.items():
         a_col = after_cols.get(col_name)
 
-        if b_col and not a_col:
+        if a_col is None:
             changes.append(SchemaChange(
                 object_type='COLUMN',
                 schema_name=schema_name,
@@ -147,7 +156,31 @@ def _process_column_level_diff(schema_name: str, table_name: str,
                 change_type='REMOVED',
                 before=b_col
             ))
-        elif not b_col and a_col:
+        # Check for type change
+        elif b_col.data_type != a_col.data_type:
+            changes.append(SchemaChange(
+                object_type='COLUMN',
+                schema_name=schema_name,
+                table_name=table_name,
+                column_name=col_name,
+                change_type='TYPE_CHANGED',
+                before=b_col,
+                after=a_col
+            ))
+        # Check for nullability change
+        elif b_col.is_nullable != a_col.is_nullable:
+            changes.append(SchemaChange(
+                object_type='COLUMN',
+                schema_name=schema_name,
+                table_name=table_name,
+                column_name=col_name,
+                change_type='NULLABILITY_CHANGED',
+                before=b_col,
+                after=a_col
+            ))
+
+    for col_name, a_col in after_cols.items():
+        if col_name not in before_cols:
             changes.append(SchemaChange(
                 object_type='COLUMN',
                 schema_name=schema_name,
@@ -156,26 +189,3 @@ def _process_column_level_diff(schema_name: str, table_name: str,
                 change_type='ADDED',
                 after=a_col
             ))
-        elif b_col and a_col:
-            # Check for type change
-            if b_col.data_type != a_col.data_type:
-                changes.append(SchemaChange(
-                    object_type='COLUMN',
-                    schema_name=schema_name,
-                    table_name=table_name,
-                    column_name=col_name,
-                    change_type='TYPE_CHANGED',
-                    before=b_col,
-                    after=a_col
-                ))
-            # Check for nullability change
-            elif b_col.is_nullable != a_col.is_nullable:
-                changes.append(SchemaChange(
-                    object_type='COLUMN',
-                    schema_name=schema_name,
-                    table_name=table_name,
-                    column_name=col_name,
-                    change_type='NULLABILITY_CHANGED',
-                    before=b_col,
-                    after=a_col
-                ))
@@ -2,11 +2,13 @@
 import logging
 import os
 from enum import Enum
-from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# File extensions that identify the input format without touching the filesystem
+_EXT_MAP: Dict[str, str] = {'.json': 'json', '.sql': 'sql'}
+
 
 class InputType(Enum):
     """Types of input sources for schema comparison."""
@@ -21,8 +23,8 @@ class InputResolutionError(ValueError):
 
 
 def resolve_input(
-    before: str,
-    after: str,
+    before: Union[str, os.PathLike],
+    after: Union[str, os.PathLike],
     warehouse: Optional[str] = None,
     dialect: Optional[str] = None
 ) -> Tuple[InputType, dict]:
@@ -38,8 +40,8 @@ def resolve_input(
        - Requires warehouse parameter for live schema fetch
 
     Args:
-        before: Before input (file path or database reference)
-        after: After input (file path or database reference)
+        before: Before input (file path, os.PathLike, or database reference)
+        after: After input (file path, os.PathLike, or database reference)
         warehouse: Optional warehouse type (required for database mode)
 
     Returns:
@@ -54,6 +56,10 @@ def resolve_input(
     Raises:
         InputResolutionError: If input cannot be resolved or is ambiguous
     """
+    # Accept pathlib.Path and other os.PathLike objects as well as strings
+    before = os.fspath(before)
+    after = os.fspath(after)
+
     # Detect input formats
     before_format = _detect_format(before)
     after_format = _detect_format(after)
@@ -100,15 +106,10 @@ def resolve_input(
 
 def _detect_format(input_str: str) -> str:
     """Detect format of an input string."""
-    input_lower = input_str.lower()
-    detected = None
-
     # Check for file extensions
-    if input_lower.endswith('.json'):
-        detected = 'json'
-    elif input_lower.endswith('.sql'):
-        detected = 'sql'
-
+    # rsplit rather than os.path.splitext, which treats '.json' as a name with no extension
+    parts = input_str.lower().rsplit('.', 1)
+    detected = _EXT_MAP.get('.' + parts[1]) if len(parts) == 2 else None
     if detected:
         return detected
 
@@ -118,12 +119,9 @@ def _detect_format(input_str: str) -> str:
         if len(parts) in (2, 3) and all(_is_valid_identifier(part) for part in parts):
             return 'database'
 
-    # Check if it's a file path (with or without extension)
+    # Existing files without a known extension default to json
     if os.path.exists(input_str):
-        path = Path(input_str)
-        if path.suffix.lower() == '.sql':
-            return 'sql'
-        return 'json'  # Default to json if invalid ext or no ext
+        return 'json'
 
     # Default fallback
     return 'database' if '.' in input_str else 'json'
@@ -1,11 +1,13 @@
 """Schema models for tables and columns."""
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class ColumnSchema(BaseModel):
     """Represents a database column definition."""
 
+    model_config = ConfigDict(frozen=True)
+
     database_name: Optional[str] = None
     schema_name: str
     table_name: str
@@ -17,6 +19,8 @@ class ColumnSchema(BaseModel):
 class TableSchema(BaseModel):
     """Represents a database table definition."""
 
+    model_config = ConfigDict(frozen=True)
+
     database_name: Optional[str] = None
     schema_name: str
     table_name: str
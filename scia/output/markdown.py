@@ -1,87 +1,86 @@
 """Markdown output rendering for risk assessments."""
+import io
+
 from scia.core.risk import RiskAssessment
+from scia.models.finding import Severity
+
+# Severity is a str enum, so plain "HIGH"/"MEDIUM"/"LOW" strings hit the same keys
+_SEVERITY_ICON = {
+    Severity.HIGH: "🔴",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🟢",
+}
+
+# Sort order for findings (HIGH > MEDIUM > LOW)
+_SEVERITY_PRIORITY = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
 
 def render_markdown(assessment: RiskAssessment) -> str:
     """Render risk assessment as Markdown report."""
     # Determine classification emoji
-    class_emoji = "🟢"
-    if assessment.classification == "HIGH":
-        class_emoji = "🔴"
-    elif assessment.classification == "MEDIUM":
-        class_emoji = "🟡"
+    class_emoji = _SEVERITY_ICON.get(assessment.classification, "🟢")
 
-    lines = [
-        "# SCIA Impact Report",
-        f"**Overall Risk Score:** {assessment.risk_score}/100",
-        f"**Classification:** {class_emoji} {assessment.classification}",
-        ""
-    ]
+    # Lines are written newline-first so the report has no trailing newline
+    buf = io.StringIO()
+    w = buf.write
+    w("# SCIA Impact Report")
+    w(f"\n**Overall Risk Score:** {assessment.risk_score}/100")
+    w(f"\n**Classification:** {class_emoji} {assessment.classification}")
+    w("\n")
 
     if assessment.warnings:
-        lines.append("### ⚠️ Warnings")
+        w("\n### ⚠️ Warnings")
         for warning in assessment.warnings:
-            lines.append(f"- {warning}")
-        lines.append("")
+            w(f"\n- {warning}")
+        w("\n")
 
-    lines.extend([
-        "## Findings",
-        ""
-    ])
+    w("\n## Findings\n")
 
     if not assessment.findings:
-        lines.append("No impactful changes detected.")
+        w("\nNo impactful changes detected.")
     else:
         # Sort findings by severity (HIGH > MEDIUM > LOW)
-        severity_priority = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
         sorted_findings = sorted(
             assessment.findings,
-            key=lambda f: severity_priority.get(
+            key=lambda f: _SEVERITY_PRIORITY.get(
                 f.severity.value if hasattr(f.severity, 'value') else str(f.severity),
                 3
             )
         )
 
         for finding in sorted_findings:
-            if finding.severity == "HIGH":
-                emoji = "🔴"
-            elif finding.severity == "MEDIUM":
-                emoji = "🟡"
-            else:
-                emoji = "🟢"
-            lines.append(f"### {emoji} {finding.finding_type.value} (Score: {finding.risk_score})")
-            lines.append(f"- **Severity:** {finding.severity.value}")
-            lines.append(f"- **Description:** {finding.description}")
-            lines.append(f"- **Evidence:** `{finding.evidence}`")
+            emoji = _SEVERITY_ICON.get(finding.severity, "🟢")
+            w(f"\n### {emoji} {finding.finding_type.value} (Score: {finding.risk_score})")
+            w(f"\n- **Severity:** {finding.severity.value}")
+            w(f"\n- **Description:** {finding.description}")
+            w(f"\n- **Evidence:** `{finding.evidence}`")
 
             # Add Impact Detail if present (EnrichedFinding)
             if hasattr(finding, 'impact_detail') and finding.impact_detail:
                 impact = finding.impact_detail
-                lines.append("")
-                lines.append("#### 📉 Downstream Impact")
+                w("\n\n#### 📉 Downstream Impact")
                 if impact.direct_dependents:
-                    lines.append("| Object Type | Name | Schema | Critical |")
-                    lines.append("|-------------|------|--------|----------|")
+                    w("\n| Object Type | Name | Schema | Critical |")
+                    w("\n|-------------|------|--------|----------|")
                     for dep in impact.direct_dependents:
-                        lines.append(
-                            f"| {dep.object_type} | {dep.name} | "
+                        w(
+                            f"\n| {dep.object_type} | {dep.name} | "
                             f"{dep.schema_name} | {'Yes' if dep.is_critical else 'No'} |"
                         )
                 else:
-                    lines.append("No direct downstream dependents identified.")
+                    w("\nNo direct downstream dependents identified.")
                 
                 # Show tables with FKs referencing this table
                 if impact.downstream_tables:
-                    lines.append("")
-                    lines.append("#### 🔗 Tables Referencing This Table (via Foreign Keys)")
-                    lines.append("| Table | Schema | Critical |")
-                    lines.append("|-------|--------|----------|")
+                    w("\n\n#### 🔗 Tables Referencing This Table (via Foreign Keys)")
+                    w("\n| Table | Schema | Critical |")
+                    w("\n|-------|--------|----------|")
                     for dep in impact.downstream_tables:
-                        lines.append(
-                            f"| {dep.name} | {dep.schema_name} | "
+                        w(
+                            f"\n| {dep.name} | {dep.schema_name} | "
                             f"{'Yes' if dep.is_critical else 'No'} |"
                         )
                 
-                lines.append(f"- **Estimated Blast Radius:** {impact.estimated_blast_radius}")
-            lines.append("")
+                w(f"\n- **Estimated Blast Radius:** {impact.estimated_blast_radius}")
+            w("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -1,15 +1,38 @@
 """DDL (Data Definition Language) parser for schema creation and modification."""
+import functools
 import logging
 import re
-from typing import Callable, Dict, List, Optional
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import sqlglot
 from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
 
 from scia.models.schema import ColumnSchema, TableSchema
 
 logger = logging.getLogger(__name__)
 
+
+def _ident(name: str) -> str:
+    """Uppercase and intern an identifier.
+
+    Table and column names repeat heavily across schemas, so interning lets
+    every model share one string per name.
+    """
+    return sys.intern(name.upper())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dialect(dialect: str) -> Dialect:
+    """Resolve a dialect name to its sqlglot Dialect once per process.
+
+    Raises:
+        ValueError: If sqlglot does not know the dialect.
+    """
+    return Dialect.get_or_raise(dialect)
+
+
 # Registry of dialect-specific preprocessors
 # Key: dialect name (e.g., 'snowflake', 'postgres', etc.)
 # Value: List of preprocessor functions
@@ -65,6 +88,14 @@ def _preprocess_sql(sql: str, dialect: str) -> str:
     return sql
 
 
+# Pattern: ALTER TABLE <table> MODIFY [COLUMN] <col_name> <data_type>
+# Matches: ALTER TABLE ... MODIFY COLUMN col_name type or ALTER TABLE ... MODIFY col_name type
+_MODIFY_COLUMN_RE = re.compile(
+    r'ALTER\s+TABLE\s+(\S+)\s+MODIFY(?:\s+COLUMN)?\s+(\S+)\s+(\S+(?:\([^)]*\))?)',
+    re.IGNORECASE
+)
+
+
 def _preprocess_snowflake_modify_column(sql: str) -> str:
     """Convert Snowflake 'ALTER TABLE ... MODIFY COLUMN' to standard 'ALTER TABLE ... ALTER COLUMN ... TYPE'.
     
@@ -81,13 +112,6 @@ def _preprocess_snowflake_modify_column(sql: str) -> str:
     Returns:
         SQL with MODIFY COLUMN converted to ALTER COLUMN TYPE
     """
-    # Pattern: ALTER TABLE <table> MODIFY [COLUMN] <col_name> <data_type>
-    # Matches: ALTER TABLE ... MODIFY COLUMN col_name type or ALTER TABLE ... MODIFY col_name type
-    pattern = re.compile(
-        r'ALTER\s+TABLE\s+(\S+)\s+MODIFY(?:\s+COLUMN)?\s+(\S+)\s+(\S+(?:\([^)]*\))?)',
-        re.IGNORECASE
-    )
-    
     def replace_match(match):
         table_name = match.group(1)
         column_name = match.group(2)
@@ -95,7 +119,7 @@ def _preprocess_snowflake_modify_column(sql: str) -> str:
         # Convert to: ALTER TABLE table_name ALTER COLUMN column_name TYPE data_type
         return f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE {data_type}"
     
-    modified_sql = pattern.sub(replace_match, sql)
+    modified_sql = _MODIFY_COLUMN_RE.sub(replace_match, sql)
     
     if modified_sql != sql:
         logger.debug("Converted MODIFY COLUMN to ALTER COLUMN TYPE syntax")
@@ -124,6 +148,13 @@ def parse_ddl_to_schema(
     Gracefully handles unsupported statements by logging warnings and skipping.
     Never raises an exception; returns empty list on complete failure.
 
+    Results are memoized on the DDL text, dialect and a value snapshot of
+    base_schemas. Schema models are frozen, so cached objects are shared
+    between calls; treat their column lists as read-only. Scripts that fail
+    to parse are not cached, so the failure is logged on every call. Use
+    parse_ddl_to_schema.cache_clear() to force a re-parse, e.g. in tests
+    that assert on per-statement log output.
+
     Args:
         ddl_sql: DDL SQL text (one or more statements)
         base_schemas: Optional list of base schemas for ALTER TABLE operations
@@ -132,22 +163,134 @@ def parse_ddl_to_schema(
     Returns:
         List of TableSchema objects extracted from CREATE TABLE and ALTER TABLE statements.
     """
-    schemas: dict = {}
+    base_key = tuple(_schema_key(s) for s in base_schemas) if base_schemas else ()
+    # Registered preprocessors are part of the key so registering a new one
+    # never serves results parsed without it
+    preprocessors = tuple(_DIALECT_PREPROCESSORS.get(dialect, ()))
+    try:
+        return list(_parse_ddl_cached(ddl_sql, base_key, dialect, preprocessors))
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("DDL parsing failed: %s", e)
+        return []
 
-    # Seed with base schemas if provided
-    if base_schemas:
-        for schema in base_schemas:
-            key = (schema.schema_name or 'PUBLIC', schema.table_name)
-            schemas[key] = schema.model_copy(deep=True)
 
-    try:
-        # Preprocess SQL for dialect-specific syntax
-        # This converts unsupported syntax to standard forms before sqlglot parsing
-        processed_sql = _preprocess_sql(ddl_sql, dialect)
-        
-        # Parse all statements in the DDL
-        statements = sqlglot.parse(processed_sql, read=dialect)
+_ColumnKey = Tuple[Optional[str], str, str, str, str, bool, int]
+_TableKey = Tuple[Optional[str], str, str, Tuple[_ColumnKey, ...]]
+
+
+def _schema_key(table: TableSchema) -> _TableKey:
+    """Hashable snapshot of a table's field values, used as a cache key."""
+    return (
+        table.database_name,
+        table.schema_name,
+        table.table_name,
+        tuple(
+            (c.database_name, c.schema_name, c.table_name, c.column_name,
+             c.data_type, c.is_nullable, c.ordinal_position)
+            for c in table.columns
+        )
+    )
+
+
+def _schema_from_key(key: _TableKey) -> TableSchema:
+    """Rebuild a table from its snapshot; the values were validated already."""
+    database_name, schema_name, table_name, columns = key
+    return TableSchema.model_construct(
+        database_name=database_name,
+        schema_name=schema_name,
+        table_name=table_name,
+        columns=[
+            ColumnSchema.model_construct(
+                database_name=col[0], schema_name=col[1], table_name=col[2],
+                column_name=col[3], data_type=col[4], is_nullable=col[5],
+                ordinal_position=col[6]
+            )
+            for col in columns
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_ddl_cached(
+    ddl_sql: str,
+    base_key: Tuple[_TableKey, ...],
+    dialect: str,
+    preprocessors: Tuple[Callable[[str], str], ...]  # pylint: disable=unused-argument
+) -> Tuple[TableSchema, ...]:
+    """Parse DDL once per distinct input; results are shared and must not be mutated.
+
+    Raises on failure so that failures are never cached.
+    """
+    base_schemas = [_schema_from_key(key) for key in base_key]
+    return tuple(_parse_ddl_uncached(ddl_sql, base_schemas, dialect))
+
+
+parse_ddl_to_schema.cache_clear = _parse_ddl_cached.cache_clear
+
+
+# Quoted strings, identifiers and $$ bodies are matched first so comment
+# markers inside them survive; only the comment alternatives are replaced.
+_COMMENT_RE = re.compile(
+    r"""'(?:[^'\\]|\\.|'')*'|"(?:[^"]|"")*"|`[^`]*`|\$\$.*?\$\$|(--[^\n]*|/\*.*?\*/)""",
+    re.S
+)
+
+
+def _strip_comments(sql: str) -> str:
+    """Replace SQL comments with a single space, leaving quoted text intact."""
+    if '--' not in sql and '/*' not in sql:
+        return sql
+    return _COMMENT_RE.sub(lambda m: ' ' if m.group(1) else m.group(0), sql)
+
+
+def _parse_ddl_uncached(
+    ddl_sql: str,
+    base_schemas: List[TableSchema],
+    dialect: str
+) -> List[TableSchema]:
+    """Preprocess and parse DDL text, then apply it to the base schemas.
+
+    Parse errors propagate so the caller can log them without caching them.
+    """
+    # Preprocess SQL for dialect-specific syntax
+    # This converts unsupported syntax to standard forms before sqlglot parsing
+    processed_sql = _preprocess_sql(_strip_comments(ddl_sql), dialect)
+
+    # Plain CREATE TABLE scripts skip the general sqlglot parser
+    created = _fast_parse_create_tables(processed_sql, dialect)
+    if created is not None:
+        schemas = _seed_schemas(base_schemas)
+        for schema_obj in created:
+            schemas[(schema_obj.schema_name, schema_obj.table_name)] = schema_obj
+        return list(schemas.values())
+
+    # Parse all statements in the DDL
+    statements = sqlglot.parse(processed_sql, read=_get_dialect(dialect))
+
+    return parse_ddl_ast_to_schema(statements, base_schemas=base_schemas)
+
+
+def parse_ddl_ast_to_schema(
+    statements: Iterable[Optional[exp.Expression]],
+    base_schemas: Optional[List[TableSchema]] = None
+) -> List[TableSchema]:
+    """Apply already-parsed DDL statements to schema objects.
 
+    Same semantics as parse_ddl_to_schema, but takes sqlglot expressions so
+    callers that reuse the same DDL can parse it once. Statements are only
+    read, never modified, so they can be shared between calls. Dialect
+    preprocessing is the caller's job.
+
+    Args:
+        statements: sqlglot expressions, e.g. from sqlglot.parse()
+        base_schemas: Optional list of base schemas for ALTER TABLE operations
+
+    Returns:
+        List of TableSchema objects extracted from CREATE TABLE and ALTER TABLE statements.
+    """
+    schemas = _seed_schemas(base_schemas)
+
+    try:
         for stmt in statements:
             if not stmt:
                 continue
@@ -174,6 +317,106 @@ def parse_ddl_to_schema(
         return []
 
 
+def _seed_schemas(base_schemas: Optional[List[TableSchema]]) -> dict:
+    """Key the base schemas by (schema, table) for DDL to update.
+
+    No copy is needed: schema models are frozen and ALTER handlers replace
+    tables rather than modify them, so the caller's objects are never changed.
+    """
+    schemas: dict = {}
+    if base_schemas:
+        for schema in base_schemas:
+            key = (schema.schema_name or 'PUBLIC', schema.table_name)
+            schemas[key] = schema
+    return schemas
+
+
+# Fast path for scripts made only of plain CREATE TABLE statements:
+#   CREATE TABLE [[db.]schema.]table (col TYPE[(p[, s])] [NOT NULL], ...)
+# Anything else (quotes, comments, constraints, options, other statements)
+# falls back to sqlglot, so results always match the general parser.
+_FAST_IDENT = r'[A-Za-z_][A-Za-z0-9_]*'
+_FAST_TYPE = r'[A-Za-z][A-Za-z0-9_]*(?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?'
+_FAST_COLUMN = rf'({_FAST_IDENT})\s+({_FAST_TYPE})(\s+NOT\s+NULL)?'
+_FAST_COLUMN_RE = re.compile(_FAST_COLUMN, re.IGNORECASE)
+_FAST_COLUMN_LIST_RE = re.compile(
+    rf'{_FAST_IDENT}\s+{_FAST_TYPE}(?:\s+NOT\s+NULL)?'
+    rf'(?:\s*,\s*{_FAST_IDENT}\s+{_FAST_TYPE}(?:\s+NOT\s+NULL)?)*',
+    re.IGNORECASE
+)
+_FAST_CREATE_RE = re.compile(
+    rf'\s*CREATE\s+TABLE\s+((?:{_FAST_IDENT}\.){{0,2}}{_FAST_IDENT})\s*\((.*)\)\s*',
+    re.IGNORECASE | re.DOTALL
+)
+_FAST_REJECT_RE = re.compile(r"""['"`$]|--|/\*|//""")
+
+
+@functools.lru_cache(maxsize=256)
+def _fast_type_sql(type_text: str, dialect: str) -> Optional[str]:
+    """Render a column type the way the sqlglot path does, or None if unknown."""
+    try:
+        data_type = exp.DataType.build(type_text, dialect=dialect)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    if data_type.this == exp.DataType.Type.USERDEFINED:
+        return None
+    return data_type.sql(dialect='snowflake').upper()
+
+
+def _fast_parse_create_tables(sql: str, dialect: str) -> Optional[List[TableSchema]]:
+    """Parse a script of plain CREATE TABLE statements without sqlglot.
+
+    Returns:
+        TableSchema objects in statement order, or None when any part of the
+        script is outside the fast-path grammar.
+    """
+    if _FAST_REJECT_RE.search(sql):
+        return None
+    keywords = _get_dialect(dialect).tokenizer_class.KEYWORDS
+
+    created = []
+    for statement in sql.split(';'):
+        if not statement.strip():
+            continue
+        match = _FAST_CREATE_RE.fullmatch(statement)
+        if not match or not _FAST_COLUMN_LIST_RE.fullmatch(match.group(2).strip()):
+            return None
+
+        parts = [_ident(part) for part in match.group(1).split('.')]
+        if any(part in keywords for part in parts):
+            return None
+        table_name = parts[-1]
+        schema_name = parts[-2] if len(parts) > 1 else 'PUBLIC'
+        if schema_name == 'NONE':
+            schema_name = 'PUBLIC'
+        db_name = parts[-3] if len(parts) > 2 else None
+
+        columns = []
+        for ordinal_pos, col_match in enumerate(_FAST_COLUMN_RE.finditer(match.group(2)), 1):
+            col_name = _ident(col_match.group(1))
+            data_type = _fast_type_sql(col_match.group(2), dialect)
+            if col_name in keywords or data_type is None:
+                return None
+            columns.append(ColumnSchema(
+                database_name=db_name,
+                schema_name=schema_name,
+                table_name=table_name,
+                column_name=col_name,
+                data_type=data_type,
+                is_nullable=col_match.group(3) is None,
+                ordinal_position=ordinal_pos
+            ))
+
+        created.append(TableSchema(
+            database_name=db_name,
+            schema_name=schema_name,
+            table_name=table_name,
+            columns=columns
+        ))
+
+    return created or None
+
+
 def _handle_create_table(stmt: exp.Create) -> Optional[TableSchema]:
     """Extract TableSchema from CREATE TABLE statement."""
     try:
@@ -237,9 +480,9 @@ def _extract_table_context(table_schema: exp.Table):
             database_name.name if hasattr(database_name, 'name')
             else str(database_name)
         )
-        target_db_name = target_db_name.upper()
+        target_db_name = _ident(target_db_name)
 
-    return table_name.upper(), schema_name.upper(), target_db_name
+    return _ident(table_name), _ident(schema_name), target_db_name
 
 def _extract_columns_from_schema(schema_def, schema_name, table_name, db_name):
     """Extract list of ColumnSchema from schema definition."""
@@ -304,10 +547,10 @@ def _extract_column_from_columndef(
                     break
 
         return ColumnSchema(
-            database_name=db_name.upper() if db_name else None,
+            database_name=_ident(db_name) if db_name else None,
             schema_name=schema_name,
-            table_name=table_name.upper(),
-            column_name=col_name.upper(),
+            table_name=_ident(table_name),
+            column_name=_ident(col_name),
             data_type=data_type.upper(),
             is_nullable=is_nullable,
             ordinal_position=ordinal_pos
@@ -320,20 +563,25 @@ def _extract_column_from_columndef(
 
 def _handle_alter_actions(
     stmt: exp.Alter,
-    table_schema: TableSchema,
-    schema_name: str,
-    table_name: str
+    schemas: dict,
+    key: tuple
 ) -> None:
-    """Process specific actions within an ALTER TABLE statement."""
+    """Process specific actions within an ALTER TABLE statement.
+
+    Schema models are frozen, so each action builds a replacement
+    TableSchema that is stored back under key.
+    """
+    schema_name, table_name = key
     for action in stmt.args.get('actions', []):
+        table_schema = schemas[key]
         if isinstance(action, exp.ColumnDef):
-            _handle_add_column(action, table_schema, schema_name, table_name)
+            schemas[key] = _handle_add_column(action, table_schema, schema_name, table_name)
         elif isinstance(action, exp.Drop) and action.args.get('kind') == 'COLUMN':
-            _handle_drop_column(action, table_schema)
+            schemas[key] = _handle_drop_column(action, table_schema)
         elif isinstance(action, exp.RenameColumn):
-            _handle_rename_column(action, table_schema)
+            schemas[key] = _handle_rename_column(action, table_schema)
         elif isinstance(action, exp.AlterColumn):
-            _handle_modify_column(action, table_schema)
+            schemas[key] = _handle_modify_column(action, table_schema)
 
 
 def _handle_add_column(
@@ -341,47 +589,57 @@ def _handle_add_column(
     table_schema: TableSchema,
     schema_name: str,
     table_name: str
-) -> None:
+) -> TableSchema:
     """Handle ADD COLUMN action."""
     new_col = _extract_column_from_columndef(
         action, schema_name, table_name, len(table_schema.columns) + 1
     )
-    if new_col:
-        table_schema.columns.append(new_col)
+    if not new_col:
+        return table_schema
+    return table_schema.model_copy(update={'columns': [*table_schema.columns, new_col]})
 
 
-def _handle_drop_column(action: exp.Drop, table_schema: TableSchema) -> None:
+def _handle_drop_column(action: exp.Drop, table_schema: TableSchema) -> TableSchema:
     """Handle DROP COLUMN action."""
     col_name = action.this.name.upper()
-    table_schema.columns = [
+    return table_schema.model_copy(update={'columns': [
         c for c in table_schema.columns
         if c.column_name.upper() != col_name
-    ]
+    ]})
 
 
-def _handle_rename_column(action: exp.RenameColumn, table_schema: TableSchema) -> None:
+def _handle_rename_column(action: exp.RenameColumn, table_schema: TableSchema) -> TableSchema:
     """Handle RENAME COLUMN action."""
     old_name = action.this.name.upper()
-    new_name = action.args.get('to').name.upper()
-    for col in table_schema.columns:
-        if col.column_name.upper() == old_name:
-            col.column_name = new_name
+    new_name = _ident(action.args.get('to').name)
+    return table_schema.model_copy(update={'columns': [
+        c.model_copy(update={'column_name': new_name})
+        if c.column_name.upper() == old_name else c
+        for c in table_schema.columns
+    ]})
 
 
-def _handle_modify_column(action: exp.AlterColumn, table_schema: TableSchema) -> None:
+def _handle_modify_column(action: exp.AlterColumn, table_schema: TableSchema) -> TableSchema:
     """Handle MODIFY/ALTER COLUMN action."""
     col_name = action.this.name.upper()
-    for col in table_schema.columns:
-        if col.column_name.upper() == col_name:
-            # Update type if provided
-            dtype = action.args.get('dtype')
-            if dtype:
-                col.data_type = dtype.sql(dialect='snowflake').upper()
+    changes = {}
+
+    # Update type if provided
+    dtype = action.args.get('dtype')
+    if dtype:
+        changes['data_type'] = dtype.sql(dialect='snowflake').upper()
+
+    # Update nullability if provided
+    allow_null = action.args.get('allow_null')
+    if allow_null is not None:
+        changes['is_nullable'] = bool(allow_null)
 
-            # Update nullability if provided
-            allow_null = action.args.get('allow_null')
-            if allow_null is not None:
-                col.is_nullable = bool(allow_null)
+    if not changes:
+        return table_schema
+    return table_schema.model_copy(update={'columns': [
+        c.model_copy(update=changes) if c.column_name.upper() == col_name else c
+        for c in table_schema.columns
+    ]})
 
 
 def _get_table_key(stmt: exp.Alter) -> tuple:
@@ -402,7 +660,7 @@ def _get_table_key(stmt: exp.Alter) -> tuple:
     if not schema_name or str(schema_name).upper() == 'NONE':
         schema_name = 'PUBLIC'
 
-    return schema_name.upper(), table_name.upper()
+    return _ident(schema_name), _ident(table_name)
 
 
 def _handle_alter_table(
@@ -424,7 +682,7 @@ def _handle_alter_table(
             logger.debug("Table %s.%s not found for ALTER", schema_name, table_name)
             return
 
-        _handle_alter_actions(stmt, schemas[key], schema_name, table_name)
+        _handle_alter_actions(stmt, schemas, key)
 
     except Exception as e:  # pylint: disable=broad-except
         logger.warning("Failed to parse ALTER TABLE: %s", e)
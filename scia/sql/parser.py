@@ -1,11 +1,12 @@
 """SQL parsing and metadata extraction."""
+import functools
 import logging
-from typing import List, Optional, Set
+from typing import Callable, List, Optional, Set, Tuple
 
 import sqlglot
 from sqlglot import exp
 
-from scia.sql.ddl_parser import _preprocess_sql
+from scia.sql.ddl_parser import _DIALECT_PREPROCESSORS, _get_dialect, _ident, _preprocess_sql
 
 logger = logging.getLogger(__name__)
 
@@ -51,24 +52,57 @@ def _extract_join_keys(join: exp.Join, metadata: SQLMetadata):
 def parse_sql(sql: str, dialect: str = 'snowflake') -> Optional[SQLMetadata]:
     """Best-effort SQL parsing for structural signals.
 
+    Results are cached per (sql, dialect); each call returns its own copy.
+    Failures are not cached, so each failing call logs its own warning.
     Never raises fatal exception, returns None on failure.
     """
+    if not isinstance(sql, str):
+        logger.warning("SQL parsing failed: expected str, got %s", type(sql).__name__)
+        return None
+    preprocessors = tuple(_DIALECT_PREPROCESSORS.get(dialect, ()))
     try:
-        metadata = SQLMetadata()
-        # Preprocess SQL for dialect-specific syntax
-        processed_sql = _preprocess_sql(sql, dialect)
-        # Parse using specified dialect
-        for expression in sqlglot.parse(processed_sql, read=dialect):
-            if expression:
-                _extract_metadata(expression, metadata)
-        return metadata
+        cached = _parse_sql_cached(sql, dialect, preprocessors)
     except (AttributeError, ValueError, TypeError) as e:
         logger.warning("SQL parsing failed: %s", e)
         return None
+    metadata = SQLMetadata()
+    metadata.tables = set(cached.tables)
+    metadata.columns = set(cached.columns)
+    metadata.join_keys = list(cached.join_keys)
+    metadata.group_by_cols = set(cached.group_by_cols)
+    return metadata
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_sql_cached(
+    sql: str,
+    dialect: str,
+    preprocessors: Tuple[Callable[[str], str], ...]  # pylint: disable=unused-argument
+) -> SQLMetadata:
+    """Parse SQL once per distinct input; the result is shared and must not be mutated.
+
+    Raises on failure so that failures are never cached.
+    """
+    metadata = SQLMetadata()
+    # Preprocess SQL for dialect-specific syntax
+    processed_sql = _preprocess_sql(sql, dialect)
+    # Parse using specified dialect
+    for expression in sqlglot.parse(processed_sql, read=_get_dialect(dialect)):
+        if expression:
+            _extract_metadata(expression, metadata)
+    return metadata
+
+
+parse_sql.cache_info = _parse_sql_cached.cache_info
+parse_sql.cache_clear = _parse_sql_cached.cache_clear
+
 
 def extract_table_references(sql: str, dialect: str = 'snowflake') -> List[str]:
     """Extract all table references from a SQL query.
 
+    Results are cached per (sql, dialect), since the same view or model SQL
+    is commonly analyzed many times. Failures are not cached.
+
     Args:
         sql: SQL query text
         dialect: SQL dialect (default: snowflake)
@@ -77,27 +111,45 @@ def extract_table_references(sql: str, dialect: str = 'snowflake') -> List[str]:
         List of table names referenced in qualified format (schema.table or just table).
         Empty list if parsing fails.
     """
+    preprocessors = tuple(_DIALECT_PREPROCESSORS.get(dialect, ()))
     try:
-        # Preprocess SQL for dialect-specific syntax
-        processed_sql = _preprocess_sql(sql, dialect)
-        statements = sqlglot.parse(processed_sql, read=dialect)
-        tables = set()
+        return list(_extract_table_references_cached(sql, dialect, preprocessors))
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("Failed to extract table references: %s", e)
+        return []
 
-        for stmt in statements:
-            if not stmt:
-                continue
 
-            for table in stmt.find_all(exp.Table):
-                # Get fully qualified table name
-                if hasattr(table, 'db') and table.db:
-                    qualified_name = f"{table.db}.{table.name}".upper()
-                else:
-                    qualified_name = table.name.upper()
+@functools.lru_cache(maxsize=1024)
+def _extract_table_references_cached(
+    sql: str,
+    dialect: str,
+    preprocessors: Tuple[Callable[[str], str], ...]  # pylint: disable=unused-argument
+) -> Tuple[str, ...]:
+    """Extract table references once per distinct input.
 
-                tables.add(qualified_name)
+    The registered preprocessors are part of the key so a new registration
+    invalidates earlier results. Raises on failure so that failures are
+    never cached.
+    """
+    # Preprocess SQL for dialect-specific syntax
+    processed_sql = _preprocess_sql(sql, dialect)
+    statements = sqlglot.parse(processed_sql, read=_get_dialect(dialect))
+    tables = set()
 
-        return sorted(list(tables))
+    for stmt in statements:
+        if not stmt:
+            continue
 
-    except Exception as e:  # pylint: disable=broad-except
-        logger.warning("Failed to extract table references: %s", e)
-        return []
+        for table in stmt.find_all(exp.Table):
+            # Get fully qualified table name
+            if hasattr(table, 'db') and table.db:
+                qualified_name = _ident(f"{table.db}.{table.name}")
+            else:
+                qualified_name = _ident(table.name)
+
+            tables.add(qualified_name)
+
+    return tuple(sorted(tables))
+
+
+extract_table_references.cache_clear = _extract_table_references_cached.cache_clear
@@ -1,19 +1,46 @@
 """Common test fixtures."""
 # pylint: disable=redefined-outer-name,too-many-arguments,too-many-positional-arguments
+import functools
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 from scia.models.schema import ColumnSchema, TableSchema
 from scia.models.finding import Finding, FindingType, Severity
-from scia.core.diff import SchemaDiff
+from scia.core.diff import SchemaDiff, diff_schemas
+from scia.cli.main import load_schema_file
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Fixture for the directory containing test data files."""
     return Path(__file__).parent / "fixtures"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def before_schema(fixtures_dir):
+    """Parsed fixtures/before.json, loaded once per session. Do not mutate."""
+    return load_schema_file(fixtures_dir / "before.json")
+
+@pytest.fixture(scope="session")
+def after_schema(fixtures_dir):
+    """Parsed fixtures/after.json, loaded once per session. Do not mutate."""
+    return load_schema_file(fixtures_dir / "after.json")
+
+@pytest.fixture(scope="session")
+def resolver_files(tmp_path_factory):
+    """Directory holding before/after JSON and SQL inputs, written once per session."""
+    d = tmp_path_factory.mktemp("resolver")
+    (d / "before.json").write_text("[]")
+    (d / "after.json").write_text("[]")
+    (d / "before.sql").write_text("CREATE TABLE test (id INT);")
+    (d / "after.sql").write_text("CREATE TABLE test (id INT, name VARCHAR);")
+    return d
+
+@pytest.fixture(scope="session")
 def column_factory():
-    """Factory to create ColumnSchema instances for testing."""
+    """Factory to create ColumnSchema instances for testing.
+
+    ColumnSchema is frozen, so identical calls safely share one instance.
+    """
+    @functools.lru_cache(maxsize=None)
     def _make_column(
         schema_name="PUBLIC",
         table_name="TEST_TABLE",
@@ -32,7 +59,7 @@ def column_factory():
         )
     return _make_column
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_factory(column_factory):
     """Factory to create TableSchema instances for testing."""
     def _make_table(
@@ -49,7 +76,7 @@ def table_factory(column_factory):
         )
     return _make_table
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def finding_factory():
     """Factory to create Finding instances for testing."""
     def _make_finding(
@@ -70,7 +97,7 @@ def finding_factory():
         )
     return _make_finding
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema_diff_factory():
     """Factory to create SchemaDiff instances for testing."""
     def _make_diff(changes=None):
@@ -78,3 +105,66 @@ def schema_diff_factory():
             changes = []
         return SchemaDiff(changes=changes)
     return _make_diff
+
+@pytest.fixture(scope="session")
+def noop_diff(table_factory):
+    """Diff of the default table against itself, computed once per session."""
+    table = table_factory()
+    return diff_schemas([table], [table])
+
+@pytest.fixture(scope="session")
+def sql_signals_factory():
+    """Factory for sql_signals dicts holding one SQLMetadata-shaped query.
+
+    Unset fields default to empty, like a fresh SQLMetadata.
+    """
+    def _make_signals(**fields):
+        metadata = {"tables": set(), "columns": set(), "join_keys": [], "group_by_cols": set()}
+        metadata.update(fields)
+        return {"q": SimpleNamespace(**metadata)}
+    return _make_signals
+
+class FakeCursor:
+    """Minimal stand-in for a DB-API cursor that records executed SQL."""
+
+    def __init__(self, rows=(), one=None, error=None):
+        self.rows = list(rows)
+        self.one = one
+        self.error = error
+        self.executed = []
+
+    def execute(self, sql):
+        """Record the statement, raising the configured error if any."""
+        self.executed.append(sql)
+        if self.error:
+            raise self.error
+
+    def fetchall(self):
+        """Return the configured rows."""
+        return self.rows
+
+    def fetchone(self):
+        """Return the configured single row."""
+        return self.one
+
+class FakeConn:
+    """Minimal stand-in for a DB-API connection serving one FakeCursor."""
+
+    def __init__(self, cursor=None):
+        self.fake_cursor = cursor or FakeCursor()
+        self.closed = False
+
+    def cursor(self):
+        """Return the shared fake cursor."""
+        return self.fake_cursor
+
+    def close(self):
+        """Mark the connection closed."""
+        self.closed = True
+
+@pytest.fixture(scope="session")
+def fake_conn_factory():
+    """Factory for FakeConn objects; keyword arguments configure the FakeCursor."""
+    def _make_conn(**cursor_kwargs):
+        return FakeConn(FakeCursor(**cursor_kwargs))
+    return _make_conn
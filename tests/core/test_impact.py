@@ -28,7 +28,6 @@ def mock_adapter():
     ]
     return adapter
 
-@pytest.mark.asyncio
 async def test_analyze_downstream_direct(mock_adapter):
     """Test finding direct downstream dependencies."""
     # table1 -> view1
@@ -38,7 +37,6 @@ async def test_analyze_downstream_direct(mock_adapter):
     assert dependents[0].name == "view1"
     assert dependents[0].object_type == "VIEW"
 
-@pytest.mark.asyncio
 async def test_analyze_downstream_transitive(mock_adapter):
     """Test finding transitive downstream dependencies."""
     # table1 -> view1 -> view2
@@ -49,7 +47,6 @@ async def test_analyze_downstream_transitive(mock_adapter):
     assert "view1" in names
     assert "view2" in names
 
-@pytest.mark.asyncio
 async def test_analyze_upstream(mock_adapter):
     """Test finding upstream dependencies."""
     # table1 -> parent_table
@@ -60,7 +57,6 @@ async def test_analyze_upstream(mock_adapter):
     assert upstream[0].object_type == "TABLE"
     assert upstream[0].is_critical is True
 
-@pytest.mark.asyncio
 async def test_analyze_downstream_max_depth(mock_adapter):
     """Test respecting max depth limit."""
     # depth 1 should only return view1
@@ -68,7 +64,6 @@ async def test_analyze_downstream_max_depth(mock_adapter):
     assert len(dependents) == 1
     assert dependents[0].name == "view1"
 
-@pytest.mark.asyncio
 async def test_analyze_downstream_no_views(mock_adapter):
     """Test behavior when no views exist."""
     mock_adapter.fetch_views.return_value = {}
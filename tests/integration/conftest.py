@@ -0,0 +1,59 @@
+"""Fixtures shared by the CLI integration tests."""
+import io
+import os
+import subprocess
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+import pytest
+
+from scia.cli.main import main
+
+
+def _run_cli_in_process(args):
+    """Run the SCIA CLI in the test process and capture its exit code and output.
+
+    Reuses the already imported modules instead of booting an interpreter per
+    call. The result mirrors subprocess.CompletedProcess.
+    """
+    argv = [os.fspath(arg) for arg in args]
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            main(argv)
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=err)
+                code = 1
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc(file=err)
+            code = 1
+    return subprocess.CompletedProcess(["scia"] + argv, code, out.getvalue(), err.getvalue())
+
+
+@pytest.fixture(scope="session")
+def run_cli():
+    """Helper to run the SCIA CLI and capture its exit code and output.
+
+    Arguments may be strings or os.PathLike objects (e.g. tmp_path / "a.json").
+    """
+    return _run_cli_in_process
+
+
+@pytest.fixture(scope="session")
+def cli_default_result(run_cli, fixtures_dir):
+    """Result of `scia analyze` on the before/after fixtures with default flags.
+
+    Shared by tests that only inspect different fields of the same run; safe
+    because the CLI is deterministic for unchanged fixture files.
+    """
+    return run_cli([
+        "analyze",
+        "--before", fixtures_dir / "before.json",
+        "--after", fixtures_dir / "after.json"
+    ])
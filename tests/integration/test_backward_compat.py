@@ -1,21 +1,10 @@
 """Backward compatibility tests for SCIA CLI."""
-import subprocess
-import sys
 import json
 
-def run_cli(args):
-    """Helper to run the SCIA CLI as a subprocess."""
-    return subprocess.run(
-        [sys.executable, "-m", "scia.cli.main"] + args,
-        capture_output=True,
-        text=True,
-        check=False
-    )
-
-def test_legacy_diff_command(fixtures_dir):
+def test_legacy_diff_command(run_cli, fixtures_dir):
     """Test that the legacy 'diff' command still works."""
-    before = str(fixtures_dir / "before.json")
-    after = str(fixtures_dir / "after.json")
+    before = fixtures_dir / "before.json"
+    after = fixtures_dir / "after.json"
 
     # Run 'diff' instead of 'analyze'
     result = run_cli(["diff", "--before", before, "--after", after])
@@ -26,12 +15,9 @@ def test_legacy_diff_command(fixtures_dir):
     assert data["classification"] == "HIGH"
     assert len(data["findings"]) > 0
 
-def test_analyze_json_no_extra_flags(fixtures_dir):
+def test_analyze_json_no_extra_flags(cli_default_result):
     """Test analyze command with basic JSON inputs, no v0.2 flags."""
-    before = str(fixtures_dir / "before.json")
-    after = str(fixtures_dir / "after.json")
-
-    result = run_cli(["analyze", "--before", before, "--after", after])
+    result = cli_default_result
 
     assert result.returncode == 1
     data = json.loads(result.stdout)
@@ -39,12 +25,15 @@ def test_analyze_json_no_extra_flags(fixtures_dir):
     for finding in data["findings"]:
         assert "impact_detail" not in finding or finding["impact_detail"] is None
 
-def test_fail_on_backward_compat(fixtures_dir):
+def test_fail_on_backward_compat(run_cli, cli_default_result, fixtures_dir):
     """Test that --fail-on still behaves as expected for JSON inputs."""
-    before = str(fixtures_dir / "before.json")
-    after = str(fixtures_dir / "after.json")
+    before = fixtures_dir / "before.json"
+    after = fixtures_dir / "after.json"
+
+    # HIGH findings should fail by default...
+    assert cli_default_result.returncode == 1
 
-    # HIGH findings should fail when --fail-on HIGH
+    # ...and when --fail-on HIGH is passed explicitly
     result = run_cli(["analyze", "--before", before, "--after", after, "--fail-on", "HIGH"])
     assert result.returncode == 1
 
@@ -52,10 +41,10 @@ def test_fail_on_backward_compat(fixtures_dir):
     result = run_cli(["analyze", "--before", before, "--after", after, "--fail-on", "MEDIUM"])
     assert result.returncode == 1
 
-def test_ignored_v02_flags_in_json_mode(fixtures_dir):
+def test_ignored_v02_flags_in_json_mode(run_cli, fixtures_dir):
     """Test that v0.2 flags don't break JSON mode even if provided."""
-    before = str(fixtures_dir / "before.json")
-    after = str(fixtures_dir / "after.json")
+    before = fixtures_dir / "before.json"
+    after = fixtures_dir / "after.json"
 
     # These flags shouldn't cause errors in JSON mode, though they might be ignored
     result = run_cli([
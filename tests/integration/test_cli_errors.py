@@ -1,24 +1,13 @@
 """CLI error handling tests for SCIA."""
-import subprocess
-import sys
 
-def run_cli(args):
-    """Helper to run the SCIA CLI as a subprocess."""
-    return subprocess.run(
-        [sys.executable, "-m", "scia.cli.main"] + args,
-        capture_output=True,
-        text=True,
-        check=False
-    )
-
-def test_missing_warehouse_for_db_mode():
+def test_missing_warehouse_for_db_mode(run_cli):
     """Test error message when --warehouse is missing for DB mode."""
     # SCHEMA.TABLE format triggers DB mode
     result = run_cli(["analyze", "--before", "PROD.T1", "--after", "DEV.T1"])
     assert result.returncode == 1
     assert "requires --warehouse parameter" in result.stderr
 
-def test_invalid_warehouse_choice():
+def test_invalid_warehouse_choice(run_cli):
     """Test error message for invalid warehouse choice."""
     result = run_cli([
         "analyze", "--before", "b.json", "--after", "a.json", "--warehouse", "oracle"
@@ -26,7 +15,7 @@ def test_invalid_warehouse_choice():
     assert result.returncode != 0
     assert "invalid choice: 'oracle'" in result.stderr
 
-def test_invalid_dependency_depth():
+def test_invalid_dependency_depth(run_cli):
     """Test that invalid dependency depth is handled (argparse handles int)."""
     # Literal string 'abc' should fail argparse validation
     result = run_cli([
@@ -36,7 +25,7 @@ def test_invalid_dependency_depth():
     assert result.returncode != 0
     assert "invalid int value" in result.stderr
 
-def test_malformed_config_file(tmp_path):
+def test_malformed_config_file(run_cli, tmp_path):
     """Test handling of malformed connection config file."""
     bad_config = tmp_path / "bad.yaml"
     bad_config.write_text("invalid: [yaml", encoding="utf-8")
@@ -49,12 +38,12 @@ def test_malformed_config_file(tmp_path):
         "--before", "S.T1",
         "--after", "S.T2",
         "--warehouse", "snowflake",
-        "--conn-file", str(bad_config)
+        "--conn-file", bad_config
     ])
     assert result.returncode == 1 # Error: Failed to connect... (due to malformed yaml)
     assert "Error" in result.stderr or "Warning" in result.stderr
 
-def test_missing_connection_credentials(tmp_path):
+def test_missing_connection_credentials(run_cli, tmp_path):
     """Test that missing credentials result in a helpful error (or warning)."""
     # Create a config file with missing fields (empty dict)
     empty_config = tmp_path / "empty.yaml"
@@ -66,7 +55,7 @@ def test_missing_connection_credentials(tmp_path):
         "--before", "S.T1",
         "--after", "S.T2",
         "--warehouse", "snowflake",
-        "--conn-file", str(empty_config)
+        "--conn-file", empty_config
     ])
 
     # Should fail because DB mode requires working adapter
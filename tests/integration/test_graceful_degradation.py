@@ -1,33 +1,62 @@
 """Graceful degradation tests for SCIA CLI."""
 import json
+from dataclasses import dataclass
+from typing import List, Optional
 from unittest.mock import MagicMock, patch
 import pytest
+from pydantic import TypeAdapter
+import scia.cli.main as cli_main
 from scia.cli.main import run_analyze
 from scia.models.schema import TableSchema, ColumnSchema
 
-# pylint: disable=too-few-public-methods,too-many-instance-attributes
+# pylint: disable=too-few-public-methods,too-many-instance-attributes,redefined-outer-name
 
+# Serializes schema lists straight to JSON bytes, skipping the model_dump() dicts
+_LIST_ADAPTER = TypeAdapter(List[TableSchema])
+
+# Every test here drives run_analyze end to end; keep them out of the quick lane
+pytestmark = pytest.mark.slow
+
+@dataclass(frozen=True)
 class MockArgs:
     """Mock arguments for the CLI."""
-    def __init__(self, **kwargs):
-        self.before = kwargs.get('before')
-        self.after = kwargs.get('after')
-        self.warehouse = kwargs.get('warehouse')
-        self.conn_file = kwargs.get('conn_file')
-        self.dependency_depth = kwargs.get('dependency_depth', 3)
-        self.include_upstream = kwargs.get('include_upstream', True)
-        self.include_downstream = kwargs.get('include_downstream', True)
-        self.format = kwargs.get('format', 'json')
-        self.fail_on = kwargs.get('fail_on', 'HIGH')
-
-@pytest.mark.asyncio
-async def test_warehouse_connection_failure_degradation(tmp_path, capsys):
+    before: Optional[str] = None
+    after: Optional[str] = None
+    warehouse: Optional[str] = None
+    conn_file: Optional[str] = None
+    dependency_depth: int = 3
+    include_upstream: bool = True
+    include_downstream: bool = True
+    format: str = 'json'
+    fail_on: str = 'HIGH'
+
+@pytest.fixture(scope="module")
+def empty_schema_files(tmp_path_factory):
+    """Write an empty before/after schema pair once for the whole module."""
+    directory = tmp_path_factory.mktemp("degr")
+    before = directory / "before.json"
+    after = directory / "after.json"
+    before.write_bytes(b"[]")
+    after.write_bytes(b"[]")
+    return before, after
+
+@pytest.fixture
+def adapter_mock():
+    """Fresh warehouse adapter mock; tests configure side effects on it."""
+    return MagicMock()
+
+@pytest.fixture(autouse=True)
+def mock_get_adapter(adapter_mock):
+    """Route scia.cli.main.get_adapter to adapter_mock for every test."""
+    # patch.object skips resolving the dotted target path for every test
+    patcher = patch.object(cli_main, "get_adapter", return_value=adapter_mock)
+    mocked = patcher.start()
+    yield mocked
+    patcher.stop()
+
+async def test_warehouse_connection_failure_degradation(empty_schema_files, adapter_mock, capsys):
     """Test that warehouse connection failure doesn't crash the analysis."""
-    # Create dummy JSON files
-    before = tmp_path / "before.json"
-    after = tmp_path / "after.json"
-    before.write_text("[]", encoding="utf-8")
-    after.write_text("[]", encoding="utf-8")
+    before, after = empty_schema_files
 
     args = MockArgs(
         before=str(before),
@@ -35,27 +64,23 @@ async def test_warehouse_connection_failure_degradation(tmp_path, capsys):
         warehouse="snowflake"
     )
 
-    with patch("scia.cli.main.get_adapter") as mock_get_adapter:
-        mock_adapter = MagicMock()
-        mock_adapter.connect.side_effect = Exception("Connection timeout")
-        mock_get_adapter.return_value = mock_adapter
+    adapter_mock.connect.side_effect = Exception("Connection timeout")
 
-        # We expect it to NOT sys.exit(1) but continue
-        # However, run_analyze calls sys.exit(0) at the end, which raises SystemExit
-        with pytest.raises(SystemExit) as excinfo:
-            await run_analyze(args)
+    # We expect it to NOT sys.exit(1) but continue
+    # However, run_analyze calls sys.exit(0) at the end, which raises SystemExit
+    with pytest.raises(SystemExit) as excinfo:
+        await run_analyze(args)
 
-        # If it failed gracefully, it should exit with 0 (no findings in empty schema)
-        assert excinfo.value.code == 0
+    # If it failed gracefully, it should exit with 0 (no findings in empty schema)
+    assert excinfo.value.code == 0
 
-        captured = capsys.readouterr()
-        # Should have warned about connection failure
-        assert "Warning" in captured.err or "Warning" in captured.out
-        # Output should still be valid JSON
-        data = json.loads(captured.out)
-        assert "findings" in data
+    captured = capsys.readouterr()
+    # Should have warned about connection failure
+    assert "Warning" in captured.err or "Warning" in captured.out
+    # Output should still be valid JSON
+    data = json.loads(captured.out)
+    assert "findings" in data
 
-@pytest.mark.asyncio
 async def test_sql_parsing_failure_degradation(tmp_path, capsys):
     """Test that SQL parsing failure doesn't crash the analysis."""
     before = tmp_path / "before.json"
@@ -68,7 +93,7 @@ async def test_sql_parsing_failure_degradation(tmp_path, capsys):
         after=str(after)
     )
 
-    with patch("scia.cli.main.parse_ddl_to_schema") as mock_parse:
+    with patch.object(cli_main, "parse_ddl_to_schema") as mock_parse:
         mock_parse.side_effect = Exception("Parser error")
 
         with pytest.raises(SystemExit) as excinfo:
@@ -79,13 +104,9 @@ async def test_sql_parsing_failure_degradation(tmp_path, capsys):
         captured = capsys.readouterr()
         assert "findings" in json.loads(captured.out)
 
-@pytest.mark.asyncio
-async def test_metadata_missing_degradation(tmp_path, capsys):
+async def test_metadata_missing_degradation(empty_schema_files, adapter_mock, capsys):
     """Test that missing optional metadata continues gracefully."""
-    before = tmp_path / "before.json"
-    after = tmp_path / "after.json"
-    before.write_text("[]", encoding="utf-8")
-    after.write_text("[]", encoding="utf-8")
+    before, after = empty_schema_files
 
     args = MockArgs(
         before=str(before),
@@ -93,23 +114,18 @@ async def test_metadata_missing_degradation(tmp_path, capsys):
         warehouse="snowflake"
     )
 
-    with patch("scia.cli.main.get_adapter") as mock_get_adapter:
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_views.side_effect = Exception("Views unavailable")
-        mock_adapter.fetch_foreign_keys.side_effect = Exception("FKs unavailable")
-        mock_get_adapter.return_value = mock_adapter
+    adapter_mock.fetch_views.side_effect = Exception("Views unavailable")
+    adapter_mock.fetch_foreign_keys.side_effect = Exception("FKs unavailable")
 
-        with pytest.raises(SystemExit) as excinfo:
-            await run_analyze(args)
+    with pytest.raises(SystemExit) as excinfo:
+        await run_analyze(args)
 
-        assert excinfo.value.code == 0
-        captured = capsys.readouterr()
-        data = json.loads(captured.out)
-        data = json.loads(captured.out)
-        assert "findings" in data
+    assert excinfo.value.code == 0
+    captured = capsys.readouterr()
+    data = json.loads(captured.out)
+    assert "findings" in data
 
-@pytest.mark.asyncio
-async def test_foreign_keys_unavailable_only(tmp_path, caplog):  # pylint: disable=unused-argument
+async def test_foreign_keys_unavailable_only(tmp_path, adapter_mock, caplog):
     """Test that missing FKs doesn't crash upstream analysis."""
     # Create simple table that would have upstream deps normally
     before = tmp_path / "before.json"
@@ -124,8 +140,8 @@ async def test_foreign_keys_unavailable_only(tmp_path, caplog):  # pylint: disab
         ColumnSchema(schema_name="S", table_name="T1", column_name="C2", data_type="INT", is_nullable=True, ordinal_position=2)
     ])]
 
-    before.write_text(json.dumps([s.model_dump() for s in schema_before]), encoding="utf-8")
-    after.write_text(json.dumps([s.model_dump() for s in schema_after]), encoding="utf-8")
+    before.write_bytes(_LIST_ADAPTER.dump_json(schema_before))
+    after.write_bytes(_LIST_ADAPTER.dump_json(schema_after))
 
     args = MockArgs(
         before=str(before),
@@ -133,47 +149,23 @@ async def test_foreign_keys_unavailable_only(tmp_path, caplog):  # pylint: disab
         warehouse="snowflake"
     )
 
-    with patch("scia.cli.main.get_adapter") as mock_get_adapter:
-        mock_adapter = MagicMock()
-        mock_adapter.fetch_views.return_value = {} # Views work
-        mock_adapter.fetch_foreign_keys.side_effect = Exception("FKs unavailable") # FKs fail
-        mock_get_adapter.return_value = mock_adapter
+    adapter_mock.fetch_views.return_value = {} # Views work
+    adapter_mock.fetch_foreign_keys.side_effect = Exception("FKs unavailable") # FKs fail
 
-        with pytest.raises(SystemExit) as excinfo:
-            await run_analyze(args)
+    with pytest.raises(SystemExit) as excinfo:
+        await run_analyze(args)
 
-        assert excinfo.value.code == 0
-        # Should warning about FK failure in logs
-        assert "Failed to fetch foreign keys" in caplog.text
+    assert excinfo.value.code == 0
+    # Should warning about FK failure in logs
+    assert "Failed to fetch foreign keys" in caplog.text
 
-@pytest.mark.asyncio
-async def test_max_depth_limits(tmp_path, capsys):  # pylint: disable=unused-argument
+@pytest.mark.parametrize("depth", [1, 10])
+async def test_max_depth_limits(empty_schema_files, depth):
     """Test that max_depth limits (1 and 10) work without error."""
     # We just want to ensure it runs without error validation complaints
-    before = tmp_path / "before.json"
-    after = tmp_path / "after.json"
-    before.write_text("[]", encoding="utf-8")
-    after.write_text("[]", encoding="utf-8")
-
-    # Test depth 1
-    args1 = MockArgs(before=str(before), after=str(after), warehouse="snowflake", dependency_depth=1)
-
-    with patch("scia.cli.main.get_adapter") as mock_get_adapter:
-        mock_adapter = MagicMock()
-        mock_get_adapter.return_value = mock_adapter
-
-        with pytest.raises(SystemExit) as excinfo:
-            await run_analyze(args1)
-        assert excinfo.value.code == 0
-
-    # Test depth 10
-    args10 = MockArgs(before=str(before), after=str(after), warehouse="snowflake", dependency_depth=10)
-
-    with patch("scia.cli.main.get_adapter") as mock_get_adapter:
-        mock_adapter = MagicMock()
-        mock_get_adapter.return_value = mock_adapter
-
-        with pytest.raises(SystemExit) as excinfo:
-            await run_analyze(args10)
-        assert excinfo.value.code == 0
+    before, after = empty_schema_files
+    args = MockArgs(before=str(before), after=str(after), warehouse="snowflake", dependency_depth=depth)
 
+    with pytest.raises(SystemExit) as excinfo:
+        await run_analyze(args)
+    assert excinfo.value.code == 0
@@ -1,47 +1,47 @@
 """Tests for Markdown rendering with impact details."""
+import pytest
 from scia.core.risk import RiskAssessment
 from scia.models.finding import (
     Finding, FindingType, Severity, EnrichedFinding, ImpactDetail, DependencyObject
 )
 from scia.output.markdown import render_markdown
 
-def test_render_markdown_with_impact():
-    """Test rendering markdown with impact details."""
+_COMMON = {
+    "finding_type": FindingType.COLUMN_REMOVED,
+    "severity": Severity.HIGH,
+    "base_risk": 80,
+    "evidence": {"table": "table1", "column": "col1"},
+    "description": "Column 'col1' removed",
+}
+
+def _with_impact():
+    """Removed column with one downstream view."""
     impact = ImpactDetail(
         direct_dependents=[
             DependencyObject(object_type="VIEW", name="view1", schema="public")
         ],
         estimated_blast_radius=1
     )
+    return EnrichedFinding(**_COMMON, impact_detail=impact)
 
-    finding = EnrichedFinding(
-        finding_type=FindingType.COLUMN_REMOVED,
-        severity=Severity.HIGH,
-        base_risk=80,
-        evidence={"table": "table1", "column": "col1"},
-        description="Column 'col1' removed",
-        impact_detail=impact
-    )
-
-    assessment = RiskAssessment([finding])
-    output = render_markdown(assessment)
-
-    assert "Downstream Impact" in output
-    assert "| VIEW | view1 | public | No |" in output
-    assert "**Estimated Blast Radius:** 1" in output
-
-def test_render_markdown_without_impact():
-    """Test rendering markdown without impact details."""
-    finding = Finding(
-        finding_type=FindingType.COLUMN_REMOVED,
-        severity=Severity.HIGH,
-        base_risk=80,
-        evidence={"table": "table1", "column": "col1"},
-        description="Column 'col1' removed"
-    )
+def _without_impact():
+    """Removed column with no impact details."""
+    return Finding(**_COMMON)
 
-    assessment = RiskAssessment([finding])
-    output = render_markdown(assessment)
+@pytest.mark.parametrize("make_finding,must_have,must_not", [
+    pytest.param(
+        _with_impact,
+        ["Downstream Impact", "| VIEW | view1 | public | No |", "**Estimated Blast Radius:** 1"],
+        [],
+        id="with_impact"
+    ),
+    pytest.param(_without_impact, ["table1"], ["Downstream Impact"], id="without_impact"),
+])
+def test_render_markdown_impact_section(make_finding, must_have, must_not):
+    """Test that the impact section is rendered only for enriched findings."""
+    output = render_markdown(RiskAssessment([make_finding()]))
 
-    assert "Downstream Impact" not in output
-    assert "table1" in output
+    for expected in must_have:
+        assert expected in output
+    for unexpected in must_not:
+        assert unexpected not in output
@@ -1,158 +1,144 @@
 """Tests for ALTER TABLE parsing logic."""
 import pytest
+import sqlglot
 from scia.models.schema import TableSchema, ColumnSchema
-from scia.sql.ddl_parser import parse_ddl_to_schema
+from scia.sql.ddl_parser import parse_ddl_ast_to_schema, parse_ddl_to_schema
 
-def test_alter_table_add_column():
-    """Test ALTER TABLE ADD COLUMN."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1)
-            ]
-        )
+# pylint: disable=redefined-outer-name
+
+# Built once at import; the models are frozen and the parser replaces rather
+# than modifies tables, so fixtures can share them.
+_USERS_ID_ONLY = TableSchema(
+    schema_name="PUBLIC",
+    table_name="USERS",
+    columns=[
+        ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1)
     ]
-    
-    ddl = "ALTER TABLE users ADD COLUMN email VARCHAR(255)"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+)
+
+_USERS_ID_EMAIL = TableSchema(
+    schema_name="PUBLIC",
+    table_name="USERS",
+    columns=[
+        ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1),
+        ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="EMAIL", data_type="VARCHAR", is_nullable=True, ordinal_position=2)
+    ]
+)
+
+_USERS_USERNAME = TableSchema(
+    schema_name="PUBLIC",
+    table_name="USERS",
+    columns=[
+        ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="USERNAME", data_type="VARCHAR(100)", is_nullable=True, ordinal_position=1)
+    ]
+)
+
+# Parsed once at import; the parser only reads statements, so tests can share them.
+# MODIFY COLUMN tests keep raw strings because they exercise dialect preprocessing.
+_DDL_ADD_COLUMN = sqlglot.parse("ALTER TABLE users ADD COLUMN email VARCHAR(255)", read="snowflake")
+_DDL_DROP_COLUMN = sqlglot.parse("ALTER TABLE users DROP COLUMN email", read="snowflake")
+_DDL_RENAME_COLUMN = sqlglot.parse("ALTER TABLE users RENAME COLUMN id TO user_id", read="snowflake")
+# Snowflake uses ALTER COLUMN or MODIFY
+# sqlglot parses ALTER TABLE ... ALTER COLUMN ... TYPE ... better for Snowflake
+_DDL_ALTER_COLUMN_TYPE = sqlglot.parse("ALTER TABLE users ALTER COLUMN id TYPE BIGINT", read="snowflake")
+_DDL_MULTIPLE = sqlglot.parse("""
+    ALTER TABLE users ADD COLUMN first_name VARCHAR;
+    ALTER TABLE users ADD COLUMN last_name VARCHAR;
+    ALTER TABLE users DROP COLUMN id;
+    """, read="snowflake")
+
+@pytest.fixture
+def users_id_only():
+    """USERS table with a single ID column."""
+    return [_USERS_ID_ONLY]
+
+@pytest.fixture
+def users_id_email():
+    """USERS table with ID and EMAIL columns."""
+    return [_USERS_ID_EMAIL]
+
+@pytest.fixture
+def users_username():
+    """USERS table with a single USERNAME VARCHAR(100) column."""
+    return [_USERS_USERNAME]
+
+def test_alter_table_add_column(users_id_only):
+    """Test ALTER TABLE ADD COLUMN."""
+    updated_schemas = parse_ddl_ast_to_schema(_DDL_ADD_COLUMN, base_schemas=users_id_only)
     
     assert len(updated_schemas) == 1
     assert len(updated_schemas[0].columns) == 2
     assert updated_schemas[0].columns[1].column_name == "EMAIL"
     assert updated_schemas[0].columns[1].data_type == "VARCHAR(255)"
 
-def test_alter_table_drop_column():
+def test_alter_table_drop_column(users_id_email):
     """Test ALTER TABLE DROP COLUMN."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1),
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="EMAIL", data_type="VARCHAR", is_nullable=True, ordinal_position=2)
-            ]
-        )
-    ]
-    
-    ddl = "ALTER TABLE users DROP COLUMN email"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+    updated_schemas = parse_ddl_ast_to_schema(_DDL_DROP_COLUMN, base_schemas=users_id_email)
     
     assert len(updated_schemas) == 1
     assert len(updated_schemas[0].columns) == 1
     assert updated_schemas[0].columns[0].column_name == "ID"
 
-def test_alter_table_rename_column():
+def test_alter_table_rename_column(users_id_only):
     """Test ALTER TABLE RENAME COLUMN."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1)
-            ]
-        )
-    ]
-    
-    ddl = "ALTER TABLE users RENAME COLUMN id TO user_id"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+    updated_schemas = parse_ddl_ast_to_schema(_DDL_RENAME_COLUMN, base_schemas=users_id_only)
     
     assert len(updated_schemas) == 1
     assert updated_schemas[0].columns[0].column_name == "USER_ID"
 
-def test_alter_table_modify_column():
+def test_alter_table_modify_column(users_id_only):
     """Test ALTER TABLE MODIFY COLUMN."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=True, ordinal_position=1)
-            ]
-        )
-    ]
-    
-    # Snowflake uses ALTER COLUMN or MODIFY
-    # sqlglot parses ALTER TABLE ... ALTER COLUMN ... TYPE ... better for Snowflake
-    ddl = "ALTER TABLE users ALTER COLUMN id TYPE BIGINT"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+    updated_schemas = parse_ddl_ast_to_schema(_DDL_ALTER_COLUMN_TYPE, base_schemas=users_id_only)
     
     assert len(updated_schemas) == 1
     assert updated_schemas[0].columns[0].data_type == "BIGINT"
 
-def test_alter_table_modify_column_snowflake_syntax():
+@pytest.mark.parametrize("base,ddl,expected", [
+    (_USERS_ID_ONLY, "ALTER TABLE users ADD COLUMN email VARCHAR(255)", [("ID", "INT"), ("EMAIL", "VARCHAR(255)")]),
+    (_USERS_ID_EMAIL, "ALTER TABLE users DROP COLUMN email", [("ID", "INT")]),
+    (_USERS_ID_ONLY, "ALTER TABLE users RENAME COLUMN id TO user_id", [("USER_ID", "INT")]),
+    (_USERS_ID_ONLY, "ALTER TABLE users ALTER COLUMN id TYPE BIGINT", [("ID", "BIGINT")]),
+], ids=["add", "drop", "rename", "alter_type"])
+def test_alter_table_from_ddl_string(base, ddl, expected):
+    """Test each ALTER operation end to end from DDL text."""
+    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=[base])
+
+    assert len(updated_schemas) == 1
+    assert [(c.column_name, c.data_type) for c in updated_schemas[0].columns] == expected
+
+def test_alter_table_modify_column_snowflake_syntax(users_username):
     """Test ALTER TABLE MODIFY COLUMN with Snowflake syntax."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="USERNAME", data_type="VARCHAR(100)", is_nullable=True, ordinal_position=1)
-            ]
-        )
-    ]
-    
     # Snowflake MODIFY COLUMN syntax (parsed as Command by sqlglot)
     ddl = "ALTER TABLE SCIA_TEST_DB.PUBLIC.USERS modify column USERNAME VARCHAR(255)"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=users_username)
     
     assert len(updated_schemas) == 1
     assert updated_schemas[0].columns[0].data_type == "VARCHAR(255)"
 
-def test_alter_table_with_dialect_parameter():
-    """Test that dialect parameter is passed correctly to parser."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="USERNAME", data_type="VARCHAR(100)", is_nullable=True, ordinal_position=1)
-            ]
-        )
-    ]
-    
+@pytest.mark.parametrize("dialect,expected", [
     # Snowflake dialect should convert MODIFY COLUMN
-    ddl = "ALTER TABLE users MODIFY COLUMN username VARCHAR(255)"
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema, dialect='snowflake')
-    assert updated_schemas[0].columns[0].data_type == "VARCHAR(255)"
-    
-    # Reset schema
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="USERNAME", data_type="VARCHAR(100)", is_nullable=True, ordinal_position=1)
-            ]
-        )
-    ]
-    
+    ("snowflake", "VARCHAR(255)"),
     # Other dialects should not convert (no preprocessor registered)
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema, dialect='postgres')
-    assert updated_schemas[0].columns[0].data_type == "VARCHAR(100)"
+    ("postgres", "VARCHAR(100)"),
+])
+def test_alter_table_with_dialect_parameter(users_username, dialect, expected):
+    """Test that dialect parameter is passed correctly to parser."""
+    ddl = "ALTER TABLE users MODIFY COLUMN username VARCHAR(255)"
+    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=users_username, dialect=dialect)
+    assert updated_schemas[0].columns[0].data_type == expected
 
-def test_multiple_alter_statements():
+def test_multiple_alter_statements(users_id_only):
     """Test multiple ALTER statements in one script."""
-    base_schema = [
-        TableSchema(
-            schema_name="PUBLIC",
-            table_name="USERS",
-            columns=[
-                ColumnSchema(schema_name="PUBLIC", table_name="USERS", column_name="ID", data_type="INT", is_nullable=False, ordinal_position=1)
-            ]
-        )
-    ]
-    
-    ddl = """
-    ALTER TABLE users ADD COLUMN first_name VARCHAR;
-    ALTER TABLE users ADD COLUMN last_name VARCHAR;
-    ALTER TABLE users DROP COLUMN id;
-    """
-    updated_schemas = parse_ddl_to_schema(ddl, base_schemas=base_schema)
+    updated_schemas = parse_ddl_ast_to_schema(_DDL_MULTIPLE, base_schemas=users_id_only)
     
     assert len(updated_schemas) == 1
     col_names = [c.column_name for c in updated_schemas[0].columns]
     assert "FIRST_NAME" in col_names
     assert "LAST_NAME" in col_names
     assert "ID" not in col_names
+
+def test_alter_leaves_base_schemas_untouched(users_id_only):
+    """Test that ALTER statements never modify the base schemas passed in."""
+    parse_ddl_ast_to_schema(_DDL_MULTIPLE, base_schemas=users_id_only)
+
+    assert [c.column_name for c in users_id_only[0].columns] == ["ID"]
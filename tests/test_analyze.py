@@ -1,8 +1,7 @@
-import pytest
+"""Tests for the async analyze() pipeline."""
 from unittest.mock import patch
 from scia.core.analyze import analyze
 
-@pytest.mark.asyncio
 async def test_analyze_pipeline(table_factory, column_factory):
     """Test function."""
     # Scenario: One column removed
@@ -20,7 +19,6 @@ async def test_analyze_pipeline(table_factory, column_factory):
     assert len(assessment.findings) == 1
     assert assessment.findings[0].finding_type == "COLUMN_REMOVED"
 
-@pytest.mark.asyncio
 async def test_analyze_multiple_findings(table_factory, column_factory):
     """Test function."""
     # Scenario: One column removed (HIGH), one type change (MEDIUM)
@@ -39,7 +37,6 @@ async def test_analyze_multiple_findings(table_factory, column_factory):
     assert assessment.classification == "HIGH"
     assert len(assessment.findings) == 2
 
-@pytest.mark.asyncio
 async def test_analyze_risk_integration(table_factory):
     """Test function."""
     # Scenario: No changes
@@ -49,7 +46,6 @@ async def test_analyze_risk_integration(table_factory):
     assert assessment.risk_score == 0
     assert assessment.classification == "LOW"
 
-@pytest.mark.asyncio
 @patch("scia.core.analyze.extract_signals")
 async def test_analyze_graceful_sql_degradation(mock_extract, table_factory, column_factory):
     """Test function."""
@@ -68,7 +64,6 @@ async def test_analyze_graceful_sql_degradation(mock_extract, table_factory, col
     assert assessment.risk_score == 44
     assert len(assessment.findings) == 1
 
-@pytest.mark.asyncio
 async def test_analyze_sql_signals_parameter(table_factory, column_factory):
     """Test function."""
     col1 = column_factory(column_name="C1")
@@ -1,8 +1,16 @@
 """Tests for test_cli_main."""
-import sys
+from argparse import Namespace
+from pathlib import Path
 import pytest
-from unittest.mock import patch
-from scia.cli.main import load_schema_file, main
+from scia.cli.main import load_schema_file, main, run
+
+@pytest.fixture
+def preloaded_schemas(monkeypatch, before_schema, after_schema):
+    """Serve the session-cached fixture schemas instead of re-reading the JSON files."""
+    by_name = {"before.json": before_schema, "after.json": after_schema}
+    monkeypatch.setattr(
+        "scia.cli.main.load_schema_file", lambda path: by_name[Path(path).name]
+    )
 
 def test_load_schema_file(fixtures_dir):
     """Test function."""
@@ -19,48 +27,64 @@ def test_load_schema_file_single_object(tmp_path):
     assert len(schema) == 1
     assert schema[0].table_name == "T"
 
-def test_main_analyze_success(fixtures_dir, capsys):
+@pytest.mark.usefixtures("preloaded_schemas")
+def test_main_analyze_success(fixtures_dir):
+    """Test function."""
+    before = fixtures_dir / "before.json"
+    code, out = run(Namespace(command="analyze", before=before, after=before))
+    assert code == 0
+    assert '"risk_score": 0' in out
+
+@pytest.mark.usefixtures("preloaded_schemas")
+def test_main_diff_success(fixtures_dir):
+    """Test function."""
+    before = fixtures_dir / "before.json"
+    code, out = run(Namespace(command="diff", before=before, after=before))
+    assert code == 0
+    assert '"risk_score": 0' in out
+
+@pytest.mark.usefixtures("preloaded_schemas")
+def test_main_analyze_fail_on_medium(fixtures_dir):
     """Test function."""
-    test_args = ["scia", "analyze", "--before", str(fixtures_dir / "before.json"), "--after", str(fixtures_dir / "before.json")]
-    with patch.object(sys, 'argv', test_args):
-        with pytest.raises(SystemExit) as e:
-            main()
-        assert e.value.code == 0
-        captured = capsys.readouterr()
-        assert '"risk_score": 0' in captured.out
+    code, _ = run(Namespace(
+        command="analyze", before=fixtures_dir / "before.json",
+        after=fixtures_dir / "after.json", fail_on="MEDIUM"
+    ))
+    assert code == 1 # HIGH finding triggers fail-on MEDIUM
 
-def test_main_diff_success(fixtures_dir, capsys):
+@pytest.mark.usefixtures("preloaded_schemas")
+def test_main_analyze_markdown(fixtures_dir):
     """Test function."""
-    test_args = ["scia", "diff", "--before", str(fixtures_dir / "before.json"), "--after", str(fixtures_dir / "before.json")]
-    with patch.object(sys, 'argv', test_args):
-        with pytest.raises(SystemExit) as e:
-            main()
-        assert e.value.code == 0
-        captured = capsys.readouterr()
-        assert '"risk_score": 0' in captured.out
+    code, out = run(Namespace(
+        command="analyze", before=fixtures_dir / "before.json",
+        after=fixtures_dir / "after.json", format="markdown"
+    ))
+    assert code == 1
+    assert "# SCIA Impact Report" in out
 
-def test_main_analyze_fail_on_medium(fixtures_dir, capsys):
+def test_main_no_command():
     """Test function."""
-    test_args = ["scia", "analyze", "--before", str(fixtures_dir / "before.json"), "--after", str(fixtures_dir / "after.json"), "--fail-on", "MEDIUM"]
-    with patch.object(sys, 'argv', test_args):
-        with pytest.raises(SystemExit) as e:
-            main()
-        assert e.value.code == 1 # HIGH finding triggers fail-on MEDIUM
+    with pytest.raises(SystemExit) as e:
+        main([])
+    assert e.value.code == 1
 
-def test_main_analyze_markdown(fixtures_dir, capsys):
+def test_run_reports_string_exit_message(monkeypatch, capsys):
     """Test function."""
-    test_args = ["scia", "analyze", "--before", str(fixtures_dir / "before.json"), "--after", str(fixtures_dir / "after.json"), "--format", "markdown"]
-    with patch.object(sys, 'argv', test_args):
-        with pytest.raises(SystemExit) as e:
-            main()
-        assert e.value.code == 1
-        captured = capsys.readouterr()
-        assert "# SCIA Impact Report" in captured.out
+    async def fail(_args):
+        print("partial report")
+        raise SystemExit("Error: bad input")
+    monkeypatch.setattr("scia.cli.main.run_analyze", fail)
+    code, out = run(Namespace(command="analyze"))
+    assert code == 1
+    assert out == "partial report\n"
+    assert "Error: bad input" in capsys.readouterr().err
 
-def test_main_no_command(capsys):
+def test_run_keeps_stdout_on_error(monkeypatch, capsys):
     """Test function."""
-    test_args = ["scia"]
-    with patch.object(sys, 'argv', test_args):
-        with pytest.raises(SystemExit) as e:
-            main()
-        assert e.value.code == 1
+    async def fail(_args):
+        print("partial report")
+        raise RuntimeError("boom")
+    monkeypatch.setattr("scia.cli.main.run_analyze", fail)
+    with pytest.raises(RuntimeError):
+        run(Namespace(command="analyze"))
+    assert capsys.readouterr().out == "partial report\n"
@@ -1,7 +1,13 @@
 """Tests for DDL parser."""
+import logging
+
 import pytest
+from pydantic import ValidationError
+import sqlglot
 
-from scia.sql.ddl_parser import parse_ddl_to_schema
+from scia.sql.ddl_parser import (
+    _fast_parse_create_tables, parse_ddl_ast_to_schema, parse_ddl_to_schema
+)
 from scia.sql.parser import extract_table_references
 from scia.models.schema import TableSchema, ColumnSchema
 
@@ -181,6 +187,28 @@ def test_extract_table_references_invalid_sql():
     assert isinstance(tables, list)
 
 
+def test_extract_table_references_cached_as_fresh_lists():
+    """Test that cached references are returned as independent lists."""
+    extract_table_references.cache_clear()
+    sql = "SELECT * FROM orders JOIN users ON orders.user_id = users.id"
+
+    first = extract_table_references(sql)
+    first.clear()
+
+    assert extract_table_references(sql) == ['ORDERS', 'USERS']
+
+
+def test_extract_table_references_failure_warns_every_call(caplog):
+    """Test that a failing query is not cached and warns on each call."""
+    sql = "SELECT * FROM ("
+
+    assert extract_table_references(sql) == []
+    assert extract_table_references(sql) == []
+
+    warnings = [r.getMessage() for r in caplog.records]
+    assert sum(m.startswith("Failed to extract table references") for m in warnings) == 2
+
+
 def test_parse_comments_in_sql():
     """Test that comments in SQL are ignored."""
     ddl = """
@@ -195,6 +223,30 @@ def test_parse_comments_in_sql():
     assert len(schemas[0].columns) == 2
 
 
+def test_parse_comment_markers_inside_quotes():
+    """Test that comment markers inside strings and identifiers are kept."""
+    ddl = """
+    CREATE TABLE users (
+        "a--b" VARCHAR DEFAULT '/* not a comment */',
+        name VARCHAR DEFAULT '--' -- real comment
+    );
+    """
+    schemas = parse_ddl_to_schema(ddl)
+    assert [c.column_name for c in schemas[0].columns] == ['A--B', 'NAME']
+
+
+def test_parse_comment_markers_after_escaped_quote():
+    """Test that a backslash-escaped quote does not end the string early."""
+    ddl = r"""
+    CREATE TABLE users (
+        note VARCHAR COMMENT 'it\'s -- not a comment',
+        name VARCHAR
+    );
+    """
+    schemas = parse_ddl_to_schema(ddl)
+    assert [c.column_name for c in schemas[0].columns] == ['NOTE', 'NAME']
+
+
 def test_parse_case_insensitivity():
     """Test that keywords are case-insensitive."""
     ddl = "create table Users (User_Id integer, NAME varchar)"
@@ -241,3 +293,113 @@ def test_parse_very_long_identifiers():
     
     assert schemas[0].table_name == long_name.upper()
     assert schemas[0].columns[0].column_name == long_name.upper()
+
+
+def test_parse_results_are_cached():
+    """Test that repeated parses reuse the cached schemas in a new list."""
+    parse_ddl_to_schema.cache_clear()
+    ddl = "CREATE TABLE users (id INTEGER)"
+
+    first = parse_ddl_to_schema(ddl)
+    first.clear()
+    second = parse_ddl_to_schema(ddl)
+
+    assert [c.column_name for c in second[0].columns] == ["ID"]
+    assert second is not first
+
+
+def test_parse_failure_warns_every_call(caplog):
+    """Test that unparseable DDL is not cached and warns on each call."""
+    ddl = "CREATE TABLE t (a INT"
+
+    assert parse_ddl_to_schema(ddl) == []
+    assert parse_ddl_to_schema(ddl) == []
+
+    warnings = [r.getMessage() for r in caplog.records]
+    assert sum(m.startswith("DDL parsing failed") for m in warnings) == 2
+
+
+def test_parse_cache_keyed_on_base_schema_values():
+    """Test that changing a base schema's columns invalidates the cached parse."""
+    ddl = "ALTER TABLE S.T1 ADD COLUMN NEW_COL VARCHAR"
+    base = [TableSchema(schema_name="S", table_name="T1", columns=[
+        ColumnSchema(schema_name="S", table_name="T1", column_name="A", data_type="INT", is_nullable=True, ordinal_position=1)
+    ])]
+
+    parse_ddl_to_schema(ddl, base_schemas=base)
+    base[0].columns.append(ColumnSchema(
+        schema_name="S", table_name="T1", column_name="B", data_type="INT", is_nullable=True, ordinal_position=2
+    ))
+    schemas = parse_ddl_to_schema(ddl, base_schemas=base)
+
+    assert [c.column_name for c in schemas[0].columns] == ["A", "B", "NEW_COL"]
+
+
+def test_schema_models_are_frozen():
+    """Test that parsed schema models reject attribute assignment."""
+    result = parse_ddl_to_schema("CREATE TABLE users (id INTEGER)")
+
+    with pytest.raises(ValidationError):
+        result[0].columns[0].column_name = "MUTATED"
+    with pytest.raises(ValidationError):
+        result[0].table_name = "MUTATED"
+
+
+def test_repeated_identifiers_are_interned():
+    """Test that a column name shared across tables is stored once."""
+    result = parse_ddl_to_schema("""
+    CREATE TABLE orders (user_id INTEGER);
+    CREATE TABLE "events" ("user_id" INTEGER);
+    """)
+
+    assert result[0].columns[0].column_name is result[1].columns[0].column_name
+
+
+def test_parse_cache_keyed_on_base_schemas():
+    """Test that different base schemas are not served each other's results."""
+    ddl = "ALTER TABLE S.T1 ADD COLUMN NEW_COL VARCHAR"
+    base_a = [TableSchema(schema_name="S", table_name="T1", columns=[
+        ColumnSchema(schema_name="S", table_name="T1", column_name="A", data_type="INT", is_nullable=True, ordinal_position=1)
+    ])]
+    base_b = [TableSchema(schema_name="S", table_name="T1", columns=[
+        ColumnSchema(schema_name="S", table_name="T1", column_name="B", data_type="INT", is_nullable=True, ordinal_position=1)
+    ])]
+
+    schemas_a = parse_ddl_to_schema(ddl, base_schemas=base_a)
+    schemas_b = parse_ddl_to_schema(ddl, base_schemas=base_b)
+
+    assert [c.column_name for c in schemas_a[0].columns] == ["A", "NEW_COL"]
+    assert [c.column_name for c in schemas_b[0].columns] == ["B", "NEW_COL"]
+    assert [c.column_name for c in base_a[0].columns] == ["A"]
+
+
+@pytest.mark.parametrize("ddl", [
+    "CREATE TABLE users (id INTEGER NOT NULL, name VARCHAR(100), email VARCHAR)",
+    "create table Users (User_Id integer, NAME varchar)",
+    "CREATE TABLE db.sch.orders (amount NUMBER(10, 2) NOT NULL, note STRING, ts TIMESTAMP)",
+    "CREATE TABLE a (x INT); CREATE TABLE s.b (y BIGINT NOT NULL);",
+    "CREATE TABLE a (x INT); CREATE TABLE a (x VARCHAR(10));",
+])
+def test_fast_create_path_matches_sqlglot(ddl):
+    """Test that the CREATE TABLE fast path produces the same schemas as sqlglot."""
+    fast = _fast_parse_create_tables(ddl, "snowflake")
+    reference = parse_ddl_ast_to_schema(sqlglot.parse(ddl, read="snowflake"))
+
+    assert fast is not None
+    assert {(t.schema_name, t.table_name): t for t in fast} == \
+        {(t.schema_name, t.table_name): t for t in reference}
+
+
+@pytest.mark.parametrize("ddl", [
+    "CREATE TABLE users (id INT PRIMARY KEY)",
+    "CREATE TABLE users (id INT DEFAULT 0)",
+    'CREATE TABLE "Users" (id INT)',
+    "CREATE TABLE users (id INT) -- trailing comment",
+    "CREATE OR REPLACE TABLE users (id INT)",
+    "CREATE TABLE users (date DATE)",
+    "CREATE TABLE users (id INT); ALTER TABLE users ADD COLUMN x INT",
+    "CREATE TABLE users (id DOUBLE PRECISION)",
+])
+def test_fast_create_path_falls_back(ddl):
+    """Test that anything outside the plain CREATE TABLE grammar uses sqlglot."""
+    assert _fast_parse_create_tables(ddl, "snowflake") is None
@@ -1,10 +1,14 @@
 """Tests for schema diffing functionality."""
 from scia.core.diff import diff_schemas
 
-def test_no_op_diff(table_factory):
+def test_no_op_diff(noop_diff):
     """Test that identical schemas produce no changes."""
+    assert len(noop_diff.changes) == 0
+
+def test_equal_copies_diff(table_factory):
+    """Test that equal but distinct schema lists produce no changes."""
     table = table_factory()
-    diff = diff_schemas([table], [table])
+    diff = diff_schemas([table], [table.model_copy(deep=True)])
     assert len(diff.changes) == 0
 
 def test_column_addition(table_factory, column_factory):
@@ -124,3 +128,36 @@ def test_multiple_changes(table_factory, column_factory):
     object_types = [c.object_type for c in diff.changes]
     assert 'COLUMN' in object_types
     assert 'TABLE' in object_types
+
+def test_table_changes_follow_input_order(table_factory):
+    """Test that schema and table changes are reported in input order."""
+    before = [table_factory(table_name=name) for name in ("T3", "T1", "T2")]
+    after = [table_factory(table_name=name) for name in ("T5", "T4")]
+    after.append(table_factory(schema_name="NEW_SCHEMA", table_name="T6"))
+
+    diff = diff_schemas(before, after)
+
+    assert [(c.change_type, c.table_name) for c in diff.changes] == [
+        ('REMOVED', 'T3'), ('REMOVED', 'T1'), ('REMOVED', 'T2'),
+        ('ADDED', 'T5'), ('ADDED', 'T4'),
+        ('ADDED', None),
+    ]
+    assert diff.changes[-1].schema_name == 'NEW_SCHEMA'
+
+def test_column_changes_follow_input_order(table_factory, column_factory):
+    """Test that column changes are reported in before order, then additions."""
+    before = [table_factory(columns=[
+        column_factory(column_name=name) for name in ("C3", "C1", "C2")
+    ])]
+    after = [table_factory(columns=[
+        column_factory(column_name="C5"),
+        column_factory(column_name="C1", data_type="INT"),
+        column_factory(column_name="C4"),
+    ])]
+
+    diff = diff_schemas(before, after)
+
+    assert [(c.change_type, c.column_name) for c in diff.changes] == [
+        ('REMOVED', 'C3'), ('TYPE_CHANGED', 'C1'), ('REMOVED', 'C2'),
+        ('ADDED', 'C5'), ('ADDED', 'C4'),
+    ]
@@ -8,13 +8,10 @@ from scia.input.resolver import (
 )
 
 
-def test_resolve_json_mode(tmp_path):
+def test_resolve_json_mode(resolver_files):
     """Test JSON input mode detection."""
-    # Create temp JSON files
-    before_file = tmp_path / "before.json"
-    after_file = tmp_path / "after.json"
-    before_file.write_text('[]')
-    after_file.write_text('[]')
+    before_file = resolver_files / "before.json"
+    after_file = resolver_files / "after.json"
 
     input_type, metadata = resolve_input(str(before_file), str(after_file))
 
@@ -24,12 +21,22 @@ def test_resolve_json_mode(tmp_path):
     assert metadata['after_format'] == 'json'
 
 
-def test_resolve_sql_mode_json_to_sql(tmp_path):
+def test_resolve_accepts_pathlike(resolver_files):
+    """Test that pathlib.Path inputs are accepted alongside strings."""
+    before_file = resolver_files / "before.json"
+    after_file = resolver_files / "after.sql"
+
+    input_type, metadata = resolve_input(before_file, after_file)
+
+    assert input_type == InputType.SQL
+    assert metadata['before_source'] == str(before_file)
+    assert metadata['after_format'] == 'sql'
+
+
+def test_resolve_sql_mode_json_to_sql(resolver_files):
     """Test SQL input mode (JSON before, SQL after)."""
-    before_file = tmp_path / "before.json"
-    after_file = tmp_path / "after.sql"
-    before_file.write_text('[]')
-    after_file.write_text('CREATE TABLE test (id INT);')
+    before_file = resolver_files / "before.json"
+    after_file = resolver_files / "after.sql"
 
     input_type, metadata = resolve_input(str(before_file), str(after_file))
 
@@ -38,12 +45,10 @@ def test_resolve_sql_mode_json_to_sql(tmp_path):
     assert metadata['after_format'] == 'sql'
 
 
-def test_resolve_sql_mode_sql_to_json(tmp_path):
+def test_resolve_sql_mode_sql_to_json(resolver_files):
     """Test SQL input mode (SQL before, JSON after)."""
-    before_file = tmp_path / "before.sql"
-    after_file = tmp_path / "after.json"
-    before_file.write_text('CREATE TABLE test (id INT);')
-    after_file.write_text('[]')
+    before_file = resolver_files / "before.sql"
+    after_file = resolver_files / "after.json"
 
     input_type, metadata = resolve_input(str(before_file), str(after_file))
 
@@ -93,10 +98,9 @@ def test_resolve_mixed_json_and_database():
         resolve_input('some.json', 'PROD.TABLE')
 
 
-def test_resolve_mixed_with_warehouse(tmp_path):
+def test_resolve_mixed_with_warehouse(resolver_files):
     """Test mixed mode with warehouse specified."""
-    before_file = tmp_path / "before.json"
-    before_file.write_text('[]')
+    before_file = resolver_files / "before.json"
 
     input_type, metadata = resolve_input(
         str(before_file),
@@ -108,12 +112,10 @@ def test_resolve_mixed_with_warehouse(tmp_path):
     assert metadata['warehouse'] == 'snowflake'
 
 
-def test_resolve_warehouse_parameter_persists(tmp_path):
+def test_resolve_warehouse_parameter_persists(resolver_files):
     """Test that warehouse parameter is included in metadata."""
-    before_file = tmp_path / "before.json"
-    after_file = tmp_path / "after.json"
-    before_file.write_text('[]')
-    after_file.write_text('[]')
+    before_file = resolver_files / "before.json"
+    after_file = resolver_files / "after.json"
 
     _, metadata = resolve_input(
         str(before_file),
@@ -124,12 +126,10 @@ def test_resolve_warehouse_parameter_persists(tmp_path):
     assert metadata['warehouse'] == 'databricks'
 
 
-def test_resolve_sql_to_sql(tmp_path):
+def test_resolve_sql_to_sql(resolver_files):
     """Test SQL to SQL mode."""
-    before_file = tmp_path / "before.sql"
-    after_file = tmp_path / "after.sql"
-    before_file.write_text('CREATE TABLE t1 (id INT);')
-    after_file.write_text('CREATE TABLE t1 (id INT, name VARCHAR);')
+    before_file = resolver_files / "before.sql"
+    after_file = resolver_files / "after.sql"
 
     input_type, metadata = resolve_input(str(before_file), str(after_file))
 
@@ -1,23 +1,37 @@
 """Tests for test_output."""
+# pylint: disable=redefined-outer-name
+import json
+import re
+import pytest
 from scia.core.risk import RiskAssessment
 from scia.output.json import render_json
 from scia.output.markdown import render_markdown
 
-def test_render_json(finding_factory):
+_HEADER_RE = re.compile(r"^# SCIA Impact Report$", re.M)
+
+@pytest.fixture(scope="module")
+def default_ra(finding_factory):
+    """Assessment with a single default finding, shared by the module."""
+    return RiskAssessment(findings=[finding_factory()])
+
+@pytest.fixture(scope="module")
+def empty_ra():
+    """Assessment with no findings, shared by the module."""
+    return RiskAssessment(findings=[])
+
+def test_render_json(default_ra):
     """Test function."""
-    ra = RiskAssessment(findings=[finding_factory()])
-    output = render_json(ra)
-    assert '"risk_score": 70' in output # finding_factory default is 70
+    data = json.loads(render_json(default_ra))
+    assert data["risk_score"] == 41  # 70 / (70 + 100)
+    assert data["findings"][0]["risk_score"] == 70  # finding_factory default is 70
 
-def test_render_markdown(finding_factory):
+def test_render_markdown(default_ra):
     """Test function."""
-    ra = RiskAssessment(findings=[finding_factory()])
-    output = render_markdown(ra)
-    assert "# SCIA Impact Report" in output
+    output = render_markdown(default_ra)
+    assert _HEADER_RE.search(output)
     assert "🔴 COLUMN_REMOVED" in output
 
-def test_render_markdown_empty():
+def test_render_markdown_empty(empty_ra):
     """Test function."""
-    ra = RiskAssessment(findings=[])
-    output = render_markdown(ra)
+    output = render_markdown(empty_ra)
     assert "No impactful changes detected." in output
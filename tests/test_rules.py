@@ -1,5 +1,5 @@
 """Tests for risk analysis rules."""
-from unittest.mock import MagicMock
+import pytest
 from scia.core.rules import (
     rule_column_removed, rule_column_type_changed, rule_nullability_changed,
     rule_join_key_changed, rule_grain_change,
@@ -8,159 +8,82 @@ from scia.core.rules import (
 )
 from scia.core.diff import SchemaChange
 
-def test_rule_schema_removed(schema_diff_factory):
-    """Test schema removal detection."""
-    diff = schema_diff_factory(changes=[
-        SchemaChange(object_type="SCHEMA", schema_name="PUBLIC", change_type="REMOVED")
-    ])
-    findings = rule_schema_removed(diff)
-    assert len(findings) == 1
-    assert findings[0].finding_type == "SCHEMA_REMOVED"
-    assert findings[0].severity == "HIGH"
-
-def test_rule_table_removed(schema_diff_factory):
-    """Test table removal detection."""
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="TABLE", schema_name="PUBLIC", table_name="USERS", change_type="REMOVED"
-        )
-    ])
-    findings = rule_table_removed(diff)
-    assert len(findings) == 1
-    assert findings[0].finding_type == "TABLE_REMOVED"
-    assert findings[0].severity == "HIGH"
-
-def test_rule_column_removed_applies(schema_diff_factory, column_factory):
-    """Test function."""
-    col = column_factory()
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C", change_type="REMOVED", before=col
-        )
-    ])
-    findings = rule_column_removed(diff)
-    assert len(findings) == 1
-    assert findings[0].finding_type == "COLUMN_REMOVED"
-
-def test_rule_column_removed_skips(schema_diff_factory, column_factory):
-    """Test function."""
-    col = column_factory()
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C", change_type="ADDED", after=col
-        )
-    ])
-    findings = rule_column_removed(diff)
-    assert len(findings) == 0
-
-def test_rule_column_removed_aggregates(schema_diff_factory, column_factory):
-    """Test function."""
-    col1 = column_factory(column_name="C1")
-    col2 = column_factory(column_name="C2")
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C1", change_type="REMOVED", before=col1
-        ),
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C2", change_type="REMOVED", before=col2
-        )
-    ])
-    findings = rule_column_removed(diff)
-    assert len(findings) == 2
-
-def test_rule_column_type_changed_applies(schema_diff_factory, column_factory):
-    """Test function."""
-    col_b = column_factory(data_type="INT")
-    col_a = column_factory(data_type="STRING")
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C", change_type="TYPE_CHANGED", before=col_b, after=col_a
-        )
-    ])
-    findings = rule_column_type_changed(diff)
-    assert len(findings) == 1
-    assert findings[0].finding_type == "COLUMN_TYPE_CHANGED"
-
-def test_rule_column_type_changed_skips(schema_diff_factory, column_factory):
-    """Test function."""
-    col = column_factory()
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
+# pylint: disable=redefined-outer-name
+
+# (change_type, before overrides, after overrides); None leaves that side empty
+_COLUMN_CASES = {
+    "removed": ("REMOVED", {}, None),
+    "added": ("ADDED", None, {}),
+    "type_changed": ("TYPE_CHANGED", {"data_type": "INT"}, {"data_type": "STRING"}),
+    "nullability_changed": ("NULLABILITY_CHANGED", {"is_nullable": True}, {"is_nullable": False}),
+    # Changing from NOT NULL to NULL is usually not considered risky
+    "nullability_relaxed": ("NULLABILITY_CHANGED", {"is_nullable": False}, {"is_nullable": True}),
+}
+
+@pytest.fixture(scope="module")
+def column_changes(column_factory):
+    """Changes for each _COLUMN_CASES entry on columns C1 and C2, built once per module."""
+    def _change(change_type, before_kw, after_kw, column_name):
+        return SchemaChange(
             object_type="COLUMN", schema_name="S", table_name="T",
-            column_name="C", change_type="ADDED", after=col
+            column_name=column_name, change_type=change_type,
+            before=None if before_kw is None else column_factory(column_name=column_name, **before_kw),
+            after=None if after_kw is None else column_factory(column_name=column_name, **after_kw)
         )
-    ])
-    findings = rule_column_type_changed(diff)
-    assert len(findings) == 0
-
-def test_rule_column_type_changed_aggregates(schema_diff_factory, column_factory):
-    """Test function."""
-    col_b = column_factory(data_type="INT")
-    col_a = column_factory(data_type="STRING")
-    diff = schema_diff_factory(changes=[
+    return {
+        case: [_change(*spec, column_name=name) for name in ("C1", "C2")]
+        for case, spec in _COLUMN_CASES.items()
+    }
+
+@pytest.mark.parametrize("rule,change,expected_type", [
+    pytest.param(
+        rule_schema_removed,
+        SchemaChange(object_type="SCHEMA", schema_name="PUBLIC", change_type="REMOVED"),
+        "SCHEMA_REMOVED",
+        id="schema"
+    ),
+    pytest.param(
+        rule_table_removed,
         SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C1",
-            change_type="TYPE_CHANGED", before=col_b, after=col_a
+            object_type="TABLE", schema_name="PUBLIC", table_name="USERS", change_type="REMOVED"
         ),
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C2",
-            change_type="TYPE_CHANGED", before=col_b, after=col_a
-        )
-    ])
-    findings = rule_column_type_changed(diff)
-    assert len(findings) == 2
-
-def test_rule_nullability_changed_applies(schema_diff_factory, column_factory):
-    """Test function."""
-    col_b = column_factory(is_nullable=True)
-    col_a = column_factory(is_nullable=False)
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C",
-            change_type="NULLABILITY_CHANGED", before=col_b, after=col_a
-        )
-    ])
-    findings = rule_nullability_changed(diff)
+        "TABLE_REMOVED",
+        id="table"
+    ),
+])
+def test_rule_object_removed(schema_diff_factory, rule, change, expected_type):
+    """Test schema and table removal detection."""
+    findings = rule(schema_diff_factory(changes=[change]))
     assert len(findings) == 1
-    assert findings[0].finding_type == "COLUMN_NULLABILITY_CHANGED"
-
-def test_rule_nullability_changed_skips(schema_diff_factory, column_factory):
-    """Test function."""
-    # Changing from NOT NULL to NULL is usually not considered risky in this rule
-    col_b = column_factory(is_nullable=False)
-    col_a = column_factory(is_nullable=True)
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C",
-            change_type="NULLABILITY_CHANGED", before=col_b, after=col_a
-        )
-    ])
-    findings = rule_nullability_changed(diff)
-    assert len(findings) == 0
-
-def test_rule_nullability_changed_aggregates(schema_diff_factory, column_factory):
-    """Test function."""
-    col_b = column_factory(is_nullable=True)
-    col_a = column_factory(is_nullable=False)
-    diff = schema_diff_factory(changes=[
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C1",
-            change_type="NULLABILITY_CHANGED", before=col_b, after=col_a
-        ),
-        SchemaChange(
-            object_type="COLUMN", schema_name="S", table_name="T", column_name="C2",
-            change_type="NULLABILITY_CHANGED", before=col_b, after=col_a
-        )
-    ])
-    findings = rule_nullability_changed(diff)
-    assert len(findings) == 2
+    assert findings[0].finding_type == expected_type
+    assert findings[0].severity == "HIGH"
 
-def test_rule_join_key_changed_applies(schema_diff_factory, column_factory):
+@pytest.mark.parametrize("count", [1, 2], ids=["applies", "aggregates"])
+@pytest.mark.parametrize("rule,case,expected_type", [
+    pytest.param(rule_column_removed, "removed", "COLUMN_REMOVED", id="removed"),
+    pytest.param(rule_column_type_changed, "type_changed", "COLUMN_TYPE_CHANGED", id="type_changed"),
+    pytest.param(
+        rule_nullability_changed, "nullability_changed", "COLUMN_NULLABILITY_CHANGED",
+        id="nullability_changed"
+    ),
+])
+def test_column_rule_applies(
+    schema_diff_factory, column_changes, rule, case, expected_type, count
+):
+    """Test that column rules emit one finding per matching change."""
+    findings = rule(schema_diff_factory(changes=column_changes[case][:count]))
+    assert [f.finding_type for f in findings] == [expected_type] * count
+
+@pytest.mark.parametrize("rule,case", [
+    pytest.param(rule_column_removed, "added", id="removed"),
+    pytest.param(rule_column_type_changed, "added", id="type_changed"),
+    pytest.param(rule_nullability_changed, "nullability_relaxed", id="nullability_relaxed"),
+])
+def test_column_rule_skips(schema_diff_factory, column_changes, rule, case):
+    """Test that column rules ignore changes they do not cover."""
+    assert rule(schema_diff_factory(changes=column_changes[case][:1])) == []
+
+def test_rule_join_key_changed_applies(schema_diff_factory, column_factory, sql_signals_factory):
     """Test function."""
     col = column_factory(column_name="USER_ID")
     diff = schema_diff_factory(changes=[
@@ -169,17 +92,14 @@ def test_rule_join_key_changed_applies(schema_diff_factory, column_factory):
             column_name="USER_ID", change_type="REMOVED", before=col
         )
     ])
-    # Mock SQLMetadata object
-    mock_metadata = MagicMock()
-    mock_metadata.join_keys = [("ORDER_ID", "USER_ID")]
-    sql_signals = {"q": mock_metadata}
+    sql_signals = sql_signals_factory(join_keys=[("ORDER_ID", "USER_ID")])
 
     findings = rule_join_key_changed(diff, sql_signals=sql_signals)
     assert len(findings) == 1
     assert findings[0].finding_type == "JOIN_KEY_CHANGED"
     assert findings[0].severity == "HIGH"
 
-def test_rule_grain_change_applies(schema_diff_factory, column_factory):
+def test_rule_grain_change_applies(schema_diff_factory, column_factory, sql_signals_factory):
     """Test function."""
     col = column_factory(column_name="REGION")
     diff = schema_diff_factory(changes=[
@@ -188,15 +108,15 @@ def test_rule_grain_change_applies(schema_diff_factory, column_factory):
             column_name="REGION", change_type="REMOVED", before=col
         )
     ])
-    mock_metadata = MagicMock()
-    mock_metadata.group_by_cols = {"REGION"}
-    sql_signals = {"q": mock_metadata}
+    sql_signals = sql_signals_factory(group_by_cols={"REGION"})
 
     findings = rule_grain_change(diff, sql_signals=sql_signals)
     assert len(findings) == 1
     assert findings[0].finding_type == "GRAIN_CHANGE"
 
-def test_rule_column_type_changed_with_signals(schema_diff_factory, column_factory):
+def test_rule_column_type_changed_with_signals(
+    schema_diff_factory, column_factory, sql_signals_factory
+):
     """Test column type change with SQL signals."""
     col_b = column_factory(column_name="REVENUE", data_type="DECIMAL")
     col_a = column_factory(column_name="REVENUE", data_type="FLOAT")
@@ -206,16 +126,14 @@ def test_rule_column_type_changed_with_signals(schema_diff_factory, column_facto
             change_type="TYPE_CHANGED", before=col_b, after=col_a
         )
     ])
-    mock_metadata = MagicMock()
-    mock_metadata.columns = {"REVENUE"}
-    sql_signals = {"q": mock_metadata}
+    sql_signals = sql_signals_factory(columns={"REVENUE"})
 
     findings = rule_column_type_changed(diff, sql_signals=sql_signals)
     assert len(findings) == 1
     assert findings[0].base_risk == 50
 
 
-def test_apply_rules_with_sql_signals(schema_diff_factory, column_factory):
+def test_apply_rules_with_sql_signals(schema_diff_factory, column_factory, sql_signals_factory):
     """Test function."""
     col = column_factory(column_name="USER_ID")
     diff = schema_diff_factory(changes=[
@@ -224,9 +142,7 @@ def test_apply_rules_with_sql_signals(schema_diff_factory, column_factory):
             column_name="USER_ID", change_type="REMOVED", before=col
         )
     ])
-    mock_metadata = MagicMock()
-    mock_metadata.join_keys = [("ORDER_ID", "USER_ID")]
-    sql_signals = {"q": mock_metadata}
+    sql_signals = sql_signals_factory(join_keys=[("ORDER_ID", "USER_ID")])
 
     findings = apply_rules(diff, sql_signals=sql_signals)
     types = [f.finding_type for f in findings]
@@ -1,16 +1,27 @@
 """Tests for test_snowflake_adapter."""
 # pylint: disable=redefined-outer-name
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import pytest
+import snowflake.connector
 from scia.metadata.snowflake import SnowflakeInspector
 
+# Cursor results shared by the tests; copied into the fake cursor before use
+_SCHEMA_ROWS = (
+    ("PUBLIC", "T1", "C1", "INT", "YES", 1),
+    ("PUBLIC", "T1", "C2", "TEXT", "NO", 2),
+)
+
+_VIEW_ROWS = (
+    ("V1", "CREATE VIEW V1 AS SELECT 1"),
+    ("V2", "CREATE VIEW V2 AS SELECT 2"),
+)
+
 @pytest.fixture
-def mock_snowflake_connection():
-    """Fixture to mock snowflake connection."""
-    with patch("snowflake.connector.connect") as mock_connect:
-        mock_conn = MagicMock()
-        mock_connect.return_value = mock_conn
-        yield mock_conn
+def mock_snowflake_connection(fake_conn_factory, monkeypatch):
+    """Fake connection returned by snowflake.connector.connect; set rows on its cursor."""
+    fake_conn = fake_conn_factory()
+    monkeypatch.setattr(snowflake.connector, "connect", lambda **params: fake_conn)
+    return fake_conn
 
 def test_snowflake_connection_success(mock_snowflake_connection):
     """Test function."""
@@ -20,19 +31,15 @@ def test_snowflake_connection_success(mock_snowflake_connection):
 
 def test_snowflake_connection_failure():
     """Test function."""
-    with patch("snowflake.connector.connect", side_effect=Exception("Conn failed")):
+    with patch("snowflake.connector.connect",
+               side_effect=snowflake.connector.errors.Error("Conn failed")):
         inspector = SnowflakeInspector({"user": "test"})
-        with pytest.raises(Exception):
+        with pytest.raises(snowflake.connector.errors.Error):
             inspector.connect()
 
 def test_snowflake_fetch_schema_success(mock_snowflake_connection):
     """Test function."""
-    mock_cursor = MagicMock()
-    mock_snowflake_connection.cursor.return_value = mock_cursor
-    mock_cursor.fetchall.return_value = [
-        ("PUBLIC", "T1", "C1", "INT", "YES", 1),
-        ("PUBLIC", "T1", "C2", "TEXT", "NO", 2)
-    ]
+    mock_snowflake_connection.fake_cursor.rows = list(_SCHEMA_ROWS)
 
     inspector = SnowflakeInspector({"user": "test"})
     schema = inspector.fetch_schema("DB", "PUBLIC")
@@ -43,9 +50,7 @@ def test_snowflake_fetch_schema_success(mock_snowflake_connection):
 
 def test_snowflake_fetch_schema_empty(mock_snowflake_connection):
     """Test function."""
-    mock_cursor = MagicMock()
-    mock_snowflake_connection.cursor.return_value = mock_cursor
-    mock_cursor.fetchall.return_value = []
+    mock_snowflake_connection.fake_cursor.rows = []
 
     inspector = SnowflakeInspector({"user": "test"})
     schema = inspector.fetch_schema("DB", "PUBLIC")
@@ -53,12 +58,7 @@ def test_snowflake_fetch_schema_empty(mock_snowflake_connection):
 
 def test_snowflake_fetch_views_success(mock_snowflake_connection):
     """Test function."""
-    mock_cursor = MagicMock()
-    mock_snowflake_connection.cursor.return_value = mock_cursor
-    mock_cursor.fetchall.return_value = [
-        ("V1", "CREATE VIEW V1 AS SELECT 1"),
-        ("V2", "CREATE VIEW V2 AS SELECT 2")
-    ]
+    mock_snowflake_connection.fake_cursor.rows = list(_VIEW_ROWS)
 
     inspector = SnowflakeInspector({"user": "test"})
     views = inspector.fetch_view_definitions("DB", "PUBLIC")
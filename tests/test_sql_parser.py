@@ -42,3 +42,29 @@ def test_parse_sql_failure():
     # Passing None should trigger TypeError in sqlglot.parse and be caught
     metadata = parse_sql(None)
     assert metadata is None
+
+def test_parse_sql_cached_per_query():
+    """Test that repeated queries parse once and return independent metadata."""
+    parse_sql.cache_clear()
+    queries = ["SELECT id FROM users", "SELECT id FROM orders"]
+
+    first = [parse_sql(q) for q in queries]
+    first[0].tables.clear()
+    second = [parse_sql(q) for q in queries]
+
+    info = parse_sql.cache_info()
+    assert (info.misses, info.hits) == (2, 2)
+    assert second[0].tables == {"USERS"}
+
+def test_parse_sql_failure_warns_every_call(monkeypatch, caplog):
+    """Test that a failing query is not cached and warns on each call."""
+    def fail(_expression, _metadata):
+        raise ValueError("bad expression")
+    monkeypatch.setattr("scia.sql.parser._extract_metadata", fail)
+    sql = "SELECT id FROM failing_table"
+
+    assert parse_sql(sql) is None
+    assert parse_sql(sql) is None
+
+    warnings = [r.getMessage() for r in caplog.records]
+    assert warnings.count("SQL parsing failed: bad expression") == 2
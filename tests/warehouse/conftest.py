@@ -0,0 +1,13 @@
+"""Fixtures shared by the warehouse adapter tests."""
+from unittest.mock import MagicMock
+
+import pytest
+import snowflake.connector
+
+
+@pytest.fixture
+def connect_mock(monkeypatch):
+    """A fresh mock for snowflake.connector.connect, restored after each test."""
+    mock = MagicMock()
+    monkeypatch.setattr(snowflake.connector, "connect", mock)
+    return mock
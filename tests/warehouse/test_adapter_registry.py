@@ -31,40 +31,26 @@ def test_get_unsupported_warehouse():
         get_adapter('mysql')
 
 
-def test_get_databricks_not_implemented():
-    """Test that Databricks adapter is not yet implemented."""
-    with pytest.raises(WarehouseNotImplementedError,
-                      match="not yet implemented"):
-        get_adapter('databricks')
-
-
-def test_get_postgres_not_implemented():
-    """Test that PostgreSQL adapter is not yet implemented."""
-    with pytest.raises(WarehouseNotImplementedError,
-                      match="not yet implemented"):
-        get_adapter('postgres')
+_PLANNED = ["databricks", "postgres", "redshift"]
 
 
-def test_get_redshift_not_implemented():
-    """Test that Redshift adapter is not yet implemented."""
+@pytest.mark.parametrize("name", _PLANNED)
+def test_get_not_implemented(name):
+    """Test that stubbed warehouse adapters are not yet implemented."""
     with pytest.raises(WarehouseNotImplementedError,
                       match="not yet implemented"):
-        get_adapter('redshift')
+        get_adapter(name)
 
 
 def test_list_supported_warehouses():
     """Test listing supported warehouse types."""
     supported = list_supported_warehouses()
     assert 'snowflake' in supported
-    assert 'databricks' not in supported
-    assert 'postgres' not in supported
-    assert 'redshift' not in supported
+    assert 'snowflake' not in list_planned_warehouses()
 
 
-def test_list_planned_warehouses():
-    """Test listing planned (stub) warehouse types."""
-    planned = list_planned_warehouses()
-    assert 'snowflake' not in planned
-    assert 'databricks' in planned
-    assert 'postgres' in planned
-    assert 'redshift' in planned
+@pytest.mark.parametrize("name", _PLANNED)
+def test_list_planned_warehouses(name):
+    """Test that each planned (stub) warehouse is listed as planned, not supported."""
+    assert name in list_planned_warehouses()
+    assert name not in list_supported_warehouses()
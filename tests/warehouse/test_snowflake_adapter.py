@@ -1,61 +1,78 @@
 """Tests for Snowflake warehouse adapter."""
 # pylint: disable=redefined-outer-name
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import snowflake.connector
 
 from scia.warehouse.snowflake import SnowflakeAdapter
 
+# Cursor results shared by the tests; FakeCursor copies rows, so these stay intact
+_SCHEMA_ROWS = (
+    ('PROD', 'PUBLIC', 'USERS', 'USER_ID', 'INTEGER', 'NO', 1),
+    ('PROD', 'PUBLIC', 'USERS', 'NAME', 'VARCHAR', 'YES', 2),
+    ('PROD', 'PUBLIC', 'ORDERS', 'ORDER_ID', 'INTEGER', 'NO', 1),
+)
 
-@pytest.fixture
+_VIEW_ROWS = (
+    ('VIEW_A', 'SELECT * FROM USERS'),
+    ('VIEW_B', 'SELECT * FROM ORDERS'),
+)
+
+# SHOW IMPORTED KEYS row: [3]=pk_table_name, [4]=pk_column_name,
+# [7]=fk_table_name, [8]=fk_column_name, [12]=fk_name
+_FK_ROWS = (
+    (None, None, None, 'USERS', 'USER_ID', None, None, 'ORDERS', 'USER_ID',
+     None, None, None, 'FK_USER_ID', None, None, None, None),
+)
+
+
+@pytest.fixture(scope="module")
 def adapter():
-    """Create a Snowflake adapter instance."""
+    """Snowflake adapter shared by the module; its connection is reset per test."""
     return SnowflakeAdapter()
 
 
+@pytest.fixture(autouse=True)
+def _reset_conn(adapter):
+    """Start and finish every test with no connection on the shared adapter."""
+    adapter.conn = None
+    yield
+    adapter.conn = None
+
+
 def test_snowflake_adapter_init(adapter):
     """Test adapter initialization."""
     assert adapter.conn is None
 
 
-def test_snowflake_adapter_connect_success(adapter):
+def test_snowflake_adapter_connect_success(adapter, fake_conn_factory, connect_mock):
     """Test successful Snowflake connection."""
-    mock_conn = MagicMock()
-
-    with patch('snowflake.connector.connect', return_value=mock_conn):
-        config = {
-            'account': 'test-account',
-            'user': 'test-user',
-            'password': 'test-password'
-        }
-        adapter.connect(config)
-        assert adapter.conn is not None
+    fake_conn = fake_conn_factory()
+    connect_mock.return_value = fake_conn
+
+    config = {
+        'account': 'test-account',
+        'user': 'test-user',
+        'password': 'test-password'
+    }
+    adapter.connect(config)
+    assert adapter.conn is fake_conn
+    connect_mock.assert_called_once_with(**config)
 
 
-def test_snowflake_adapter_connect_failure(adapter):
+def test_snowflake_adapter_connect_failure(adapter, connect_mock):
     """Test connection failure handling."""
+    connect_mock.side_effect = snowflake.connector.errors.Error("Connection failed")
 
-    with patch('snowflake.connector.connect',
-               side_effect=snowflake.connector.errors.Error("Connection failed")):
-        config = {'account': 'invalid'}
-        with pytest.raises(snowflake.connector.errors.Error):
-            adapter.connect(config)
+    config = {'account': 'invalid'}
+    with pytest.raises(snowflake.connector.errors.Error):
+        adapter.connect(config)
 
 
-def test_snowflake_adapter_fetch_schema_success(adapter):
+def test_snowflake_adapter_fetch_schema_success(adapter, fake_conn_factory):
     """Test successful schema fetch."""
-    # Mock connection and cursor
-    mock_cursor = MagicMock()
-    mock_cursor.fetchall.return_value = [
-        ('PROD', 'PUBLIC', 'USERS', 'USER_ID', 'INTEGER', 'NO', 1),
-        ('PROD', 'PUBLIC', 'USERS', 'NAME', 'VARCHAR', 'YES', 2),
-        ('PROD', 'PUBLIC', 'ORDERS', 'ORDER_ID', 'INTEGER', 'NO', 1),
-    ]
-
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    adapter.conn = mock_conn
+    adapter.conn = fake_conn_factory(rows=_SCHEMA_ROWS)
 
     schemas = adapter.fetch_schema('PROD', 'PUBLIC')
 
@@ -71,31 +88,17 @@ def test_snowflake_adapter_fetch_schema_no_connection(adapter):
     assert schemas == []
 
 
-def test_snowflake_adapter_fetch_schema_failure(adapter):
+def test_snowflake_adapter_fetch_schema_failure(adapter, fake_conn_factory):
     """Test schema fetch failure handling."""
-
-    mock_cursor = MagicMock()
-    mock_cursor.execute.side_effect = snowflake.connector.errors.Error("Query failed")
-
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    adapter.conn = mock_conn
+    adapter.conn = fake_conn_factory(error=snowflake.connector.errors.Error("Query failed"))
 
     schemas = adapter.fetch_schema('PROD', 'PUBLIC')
     assert schemas == []
 
 
-def test_snowflake_adapter_fetch_views_success(adapter):
+def test_snowflake_adapter_fetch_views_success(adapter, fake_conn_factory):
     """Test successful views fetch."""
-    mock_cursor = MagicMock()
-    mock_cursor.fetchall.return_value = [
-        ('VIEW_A', 'SELECT * FROM USERS'),
-        ('VIEW_B', 'SELECT * FROM ORDERS'),
-    ]
-
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    adapter.conn = mock_conn
+    adapter.conn = fake_conn_factory(rows=_VIEW_ROWS)
 
     views = adapter.fetch_views('PROD', 'PUBLIC')
 
@@ -110,23 +113,9 @@ def test_snowflake_adapter_fetch_views_no_connection(adapter):
     assert views == {}
 
 
-def test_snowflake_adapter_fetch_foreign_keys_success(adapter):
+def test_snowflake_adapter_fetch_foreign_keys_success(adapter, fake_conn_factory):
     """Test successful foreign keys fetch."""
-    mock_cursor = MagicMock()
-    # Mock result for SHOW IMPORTED KEYS
-    # Indices: [3]=pk_table_name, [4]=pk_column_name, [7]=fk_table_name, [8]=fk_column_name, [12]=fk_name
-    row = [None] * 17
-    row[3] = 'USERS'
-    row[4] = 'USER_ID'
-    row[7] = 'ORDERS'
-    row[8] = 'USER_ID'
-    row[12] = 'FK_USER_ID'
-
-    mock_cursor.fetchall.return_value = [row]
-
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    adapter.conn = mock_conn
+    adapter.conn = fake_conn_factory(rows=_FK_ROWS)
 
     fks = adapter.fetch_foreign_keys('PROD', 'PUBLIC')
 
@@ -160,36 +149,30 @@ def test_snowflake_adapter_parse_table_references_failure(adapter):
         assert refs == []
 
 
-def test_snowflake_adapter_resolve_context(adapter):
+def test_snowflake_adapter_resolve_context(adapter, fake_conn_factory):
     """Test resolution of database and schema from Snowflake session."""
-    mock_cursor = MagicMock()
-    # First call for context resolution
-    mock_cursor.fetchone.return_value = ('MOCKED_DB', 'MOCKED_SCHEMA')
-    # Second call for the metadata query (e.g., SHOW IMPORTED KEYS)
-    mock_cursor.fetchall.return_value = []
-
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    adapter.conn = mock_conn
+    # fetchone serves context resolution; fetchall the metadata query (SHOW IMPORTED KEYS)
+    adapter.conn = fake_conn_factory(rows=[], one=('MOCKED_DB', 'MOCKED_SCHEMA'))
+    executed = adapter.conn.fake_cursor.executed
 
     # Call with empty strings to trigger resolution
     adapter.fetch_foreign_keys('', '')
 
     # Verify context was fetched
-    mock_cursor.execute.assert_any_call("SELECT CURRENT_DATABASE(), CURRENT_SCHEMA()")
+    assert "SELECT CURRENT_DATABASE(), CURRENT_SCHEMA()" in executed
     # Verify the metadata query used the resolved names
-    mock_cursor.execute.assert_any_call("SHOW IMPORTED KEYS IN SCHEMA MOCKED_DB.MOCKED_SCHEMA")
+    assert "SHOW IMPORTED KEYS IN SCHEMA MOCKED_DB.MOCKED_SCHEMA" in executed
 
 
-def test_snowflake_adapter_close(adapter):
+def test_snowflake_adapter_close(adapter, fake_conn_factory):
     """Test connection close."""
-    mock_conn = MagicMock()
-    adapter.conn = mock_conn
+    fake_conn = fake_conn_factory()
+    adapter.conn = fake_conn
 
     adapter.close()
 
     assert adapter.conn is None
-    mock_conn.close.assert_called_once()
+    assert fake_conn.closed
 
 
 def test_snowflake_adapter_close_no_connection(adapter):
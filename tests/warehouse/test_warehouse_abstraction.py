@@ -39,21 +39,15 @@ def test_warehouse_adapter_requires_fetch_schema():
         PartialAdapter()
 
 
-def test_warehouse_adapter_requires_all_methods():
-    """Test that all abstract methods must be implemented."""
-    abstract_methods = {
-        'connect',
-        'fetch_schema',
-        'fetch_views',
-        'fetch_foreign_keys',
-        'parse_table_references',
-        'close'
-    }
-
-    # Verify all methods are abstract
-    for method_name in abstract_methods:
-        assert hasattr(WarehouseAdapter, method_name)
-        method = getattr(WarehouseAdapter, method_name)
-        # Check if method is marked as abstract
-        assert hasattr(method, '__isabstractmethod__')
-        assert method.__isabstractmethod__ is True
+@pytest.mark.parametrize("method_name", [
+    'connect',
+    'fetch_schema',
+    'fetch_views',
+    'fetch_foreign_keys',
+    'parse_table_references',
+    'close',
+])
+def test_warehouse_adapter_method_is_abstract(method_name):
+    """Test that each adapter method must be implemented by subclasses."""
+    method = getattr(WarehouseAdapter, method_name)
+    assert getattr(method, '__isabstractmethod__', False) is True